@@ -37,6 +37,10 @@ class IBrowserService(ABC):
     def execute_script(self, script: str, *args) -> Any:
         """Execute JavaScript in browser."""
 
+    @abstractmethod
+    def wait_for_stable_dom(self, selector: str, max_wait: float, quiet_period: float = None) -> bool:
+        """Wait until the subtree under a selector stops mutating."""
+
     @abstractmethod
     def get_viewport_size(self) -> Dict[str, int]:
         """Get browser viewport dimensions."""
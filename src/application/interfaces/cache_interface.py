@@ -44,3 +44,6 @@ class ICacheService(ABC):
     @abstractmethod
     def result_already_in_sidebar(self, combination: Combination, available_elements: List[Element]) -> bool:
         """Check if combination result already exists in available elements."""
+
+    def close(self) -> None:
+        """Release any open storage handles (no-op for caches without any)."""
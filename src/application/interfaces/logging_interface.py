@@ -7,25 +7,32 @@ class ILoggingService(ABC):
     """Interface for logging operations."""
 
     @abstractmethod
-    def log(self, level: str, message: str) -> None:
-        """Log a message at the specified level."""
+    def log(self, level: str, message: str, *args) -> None:
+        """Log a message at the specified level (lazily %-formatted with args)."""
 
     @abstractmethod
-    def debug(self, message: str) -> None:
+    def debug(self, message: str, *args) -> None:
         """Log debug message."""
 
     @abstractmethod
-    def info(self, message: str) -> None:
+    def info(self, message: str, *args) -> None:
         """Log info message."""
 
     @abstractmethod
-    def warning(self, message: str) -> None:
+    def warning(self, message: str, *args) -> None:
         """Log warning message."""
 
     @abstractmethod
-    def error(self, message: str) -> None:
+    def error(self, message: str, *args) -> None:
         """Log error message."""
 
     @abstractmethod
     def time_operation(self, operation_name: str):
         """Context manager for timing operations."""
+
+    def is_enabled(self, level: str) -> bool:
+        """Check whether messages at a level would be output (use to skip building costly arguments)."""
+        return True
+
+    def flush(self) -> None:
+        """Write any buffered output (no-op for unbuffered loggers)."""
@@ -6,6 +6,7 @@ from .cache_service import CacheService
 from .combination_service import CombinationService
 from .drag_service import DragService
 from .element_detection_service import ElementDetectionService
+from .embedding_store import EmbeddingStore
 from .logging_service import LoggingService
 from .semantic_service import SemanticService
 from .timing_service import TimingService
@@ -16,6 +17,7 @@ __all__ = [
     "CacheService",
     "DragService",
     "ElementDetectionService",
+    "EmbeddingStore",
     "LoggingService",
     "SemanticService",
     "WorkspaceService",
@@ -7,7 +7,7 @@ from application.interfaces import IBrowserService, ICacheService, ILoggingServi
 from domain.models import Combination, CombinationResult, Element
 from domain.services import GameMechanics
 
-from .combination_service import CombinationService
+from .combination_service import FIRST_ELEMENT_MAX_WAIT, CombinationService
 from .drag_service import DragService
 from .element_detection_service import ElementDetectionService
 from .timing_service import TimingService
@@ -69,14 +69,21 @@ class AutomationOrchestrator:
         # Session tracking
         self.session_start = datetime.now()
         self.session_stats = {"combinations_attempted": 0, "elements_created": 0, "workspace_clears": 0}
+        self._initialized = False
 
     def initialize(self) -> bool:
         """
         Initialize the automation system.
 
+        Safe to call again after connect_to_game: an already initialized system
+        on a live driver returns immediately instead of rescanning.
+
         Returns:
             True if initialization successful, False otherwise
         """
+        if self._initialized and self.browser.driver:
+            return True
+
         try:
             self.logger.info("🚀 Initializing service-oriented automation system...")
 
@@ -89,6 +96,7 @@ class AutomationOrchestrator:
                 self.logger.error("❌ Failed to initialize element detection")
                 return False
 
+            self._initialized = True
             self.logger.info("✅ Automation orchestrator initialized successfully")
             return True
 
@@ -133,17 +141,22 @@ class AutomationOrchestrator:
             CombinationResult with outcome details
         """
         try:
-            # Prepare combination domain model
-            available_elements = self.element_detector.get_sidebar_elements()
+            # Prepare combination domain model from the last sidebar scan, rescanning only on a miss
+            available_elements = self.element_detector.get_known_sidebar_elements()
             element1 = self._find_element_by_name(available_elements, element1_name)
             element2 = self._find_element_by_name(available_elements, element2_name)
 
+            if not element1 or not element2:
+                available_elements = self.element_detector.get_sidebar_elements()
+                element1 = self._find_element_by_name(available_elements, element1_name)
+                element2 = self._find_element_by_name(available_elements, element2_name)
+
             if not element1 or not element2:
                 missing = element1_name if not element1 else element2_name
                 self.logger.warning(f"❌ Element '{missing}' not found in sidebar")
                 return None
 
-            combination = Combination(element1, element2)
+            combination = Combination(element1, element2, attempted_at=datetime.now())
 
             # Check cache first (coordination responsibility) - unless IGNORE_CACHE is set
             from config import config
@@ -161,6 +174,11 @@ class AutomationOrchestrator:
                         from domain.models import CombinationResult
 
                         return CombinationResult.success(combination, cached_result)
+
+                # Known to produce nothing (persisted across sessions) - skip the browser round-trips
+                if self.cache.is_combination_failed(combination):
+                    self.logger.debug(f"⏭️ CACHED NO RESULT: {combination.display_name}")
+                    return CombinationResult.no_result(combination)
             else:
                 self.logger.debug(f"🔄 IGNORE_CACHE enabled - forcing retest of {combination.display_name}")
 
@@ -265,10 +283,9 @@ class AutomationOrchestrator:
                 return result
 
             # STEP 2: Wait for first element to appear and get its actual position
-            import time
-
-            time.sleep(0.5)  # Brief wait for element to appear
-            workspace_after_first = self.workspace_manager.get_workspace_elements()
+            workspace_after_first = self.workspace_manager.wait_for_workspace_growth(
+                len(initial_workspace), FIRST_ELEMENT_MAX_WAIT
+            )
             self.logger.debug(f"📊 Workspace after 1st drag: {len(workspace_after_first)} elements")
 
             # Find the actual position of the first element for precise merging
@@ -323,6 +340,7 @@ class AutomationOrchestrator:
                     target_location.x}, {
                     target_location.y}) -> Second element to ({merge_target_x}, {merge_target_y})"
             )
+            sidebar_count = self.element_detector.count_sidebar_items()
             drag2_success = self.drag_handler.drag_element_to_workspace(
                 combination.element2.name, merge_target_x, merge_target_y, self.element_detector
             )
@@ -333,10 +351,8 @@ class AutomationOrchestrator:
                 self.cache.record_combination_result(result)
                 return result
 
-            # Wait for potential merge and check for new elements
-            import time
-
-            time.sleep(GameMechanics.get_merge_timeout())  # Wait for merge timeout
+            # Wait for potential merge (ends early once the sidebar grows) and check for new elements
+            self.element_detector.wait_for_new_sidebar_element(sidebar_count, GameMechanics.get_merge_timeout())
 
             # Check if new elements were discovered
             self.element_detector.get_sidebar_elements()
@@ -365,7 +381,12 @@ class AutomationOrchestrator:
             return result
 
     def get_session_stats(self) -> Dict:
-        """Get statistics for current session."""
+        """
+        Get statistics for current session.
+
+        Built from in-memory counters only; the workspace count is the tracked model,
+        which every combination's workspace poll already keeps in sync with the page.
+        """
         cache_stats = self.cache.get_cache_stats()
         duration_minutes = (datetime.now() - self.session_start).total_seconds() / 60
 
@@ -374,7 +395,7 @@ class AutomationOrchestrator:
             **cache_stats,
             "session_duration_minutes": round(duration_minutes, 2),
             "element_count": self.element_detector.get_element_count(),
-            "workspace_elements": len(self.workspace_manager.get_workspace_elements()),
+            "workspace_elements": self.workspace_manager.workspace.element_count,
         }
 
     def get_available_elements(self) -> List[Element]:
@@ -402,6 +423,7 @@ class AutomationOrchestrator:
             # Save cache at end of session
             self.logger.info("💾 Saving combination cache...")
             self.cache.save_cache()
+            self.cache.close()
 
             # Close browser
             self.logger.info("🔚 Closing browser...")
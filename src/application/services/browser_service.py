@@ -1,5 +1,10 @@
 """Browser service implementation using Selenium."""
 
+import os
+import shutil
+import subprocess
+import time
+import urllib.request
 from typing import Dict, List, Optional
 
 from selenium import webdriver
@@ -10,7 +15,17 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
 from application.interfaces import IBrowserService, ILoggingService
-from config import config
+
+GAME_URL = "https://neal.fun/infinite-craft/"
+
+# Executables tried (in order) when CHROME_BINARY is not set
+CHROME_CANDIDATES = [
+    "google-chrome",
+    "google-chrome-stable",
+    "chromium",
+    "chromium-browser",
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+]
 
 
 class BrowserService(IBrowserService):
@@ -29,10 +44,15 @@ class BrowserService(IBrowserService):
             headless: Run browser in headless mode
             logging_service: Service for logging operations
         """
+        from config import config
+
         self.headless = headless
         self.logger = logging_service
         self.driver = None
 
+        # True when attached over the debug port: the Chrome process outlives this service
+        self._attached = False
+
         # Browser configuration
         self._implicit_wait = config.IMPLICIT_WAIT_TIME
         self._explicit_wait = config.EXPLICIT_WAIT_TIME
@@ -74,10 +94,19 @@ class BrowserService(IBrowserService):
         Returns:
             True if connection successful, False otherwise
         """
+        from config import config
+
         if port is None:
             port = config.CHROME_DEBUG_PORT
 
         try:
+            launched = False
+            if not self._debug_port_ready(port):
+                if not config.CHROME_AUTO_LAUNCH or not self._launch_debug_chrome(port):
+                    self.logger.error(f"❌ No Chrome listening on debug port {port}")
+                    return False
+                launched = True
+
             self.logger.info(f"🔗 Connecting to existing Chrome on port {port}...")
 
             chrome_options = Options()
@@ -85,17 +114,89 @@ class BrowserService(IBrowserService):
 
             self.driver = webdriver.Chrome(options=chrome_options)
             self.driver.implicitly_wait(self._implicit_wait)
+            self._attached = True
 
             # Verify connection by checking current URL
             current_url = self.driver.current_url
             self.logger.info(f"✅ Connected to Chrome - Current URL: {current_url}")
 
+            if launched:
+                # Freshly launched: give the game page time to populate the sidebar
+                WebDriverWait(self.driver, config.GAME_LOAD_TIMEOUT).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "#sidebar .item"))
+                )
+
             return True
 
         except Exception as e:
             self.logger.error(f"❌ Failed to connect to existing Chrome: {e}")
+            if self._attached:
+                # Don't leave a chromedriver session running behind a failed connection
+                self.close()
+                self.driver = None
+                self._attached = False
+            return False
+
+    def _debug_port_ready(self, port: int) -> bool:
+        """Check whether a Chrome DevTools endpoint is answering on the port."""
+        try:
+            with urllib.request.urlopen(f"http://localhost:{port}/json/version", timeout=0.5):
+                return True
+        except OSError:
             return False
 
+    def _launch_debug_chrome(self, port: int) -> bool:
+        """
+        Launch a detached Chrome with remote debugging on the game page.
+
+        The process is left running when the bot exits so later sessions attach
+        to an already-warm browser instead of cold-starting one.
+
+        Args:
+            port: Debug port to open
+
+        Returns:
+            True if the debug endpoint came up within CHROME_CONNECTION_TIMEOUT
+        """
+        from config import config
+
+        binary = config.CHROME_BINARY or next(
+            (path for path in map(shutil.which, CHROME_CANDIDATES) if path is not None), None
+        )
+        if not binary:
+            self.logger.error("❌ Chrome executable not found - set CHROME_BINARY")
+            return False
+
+        profile_dir = os.path.expanduser(config.CHROME_USER_DATA_DIR)
+        self.logger.info(f"🚀 Launching Chrome with remote debugging on port {port}...")
+
+        try:
+            subprocess.Popen(
+                [
+                    binary,
+                    f"--remote-debugging-port={port}",
+                    f"--user-data-dir={profile_dir}",
+                    "--no-first-run",
+                    "--no-default-browser-check",
+                    GAME_URL,
+                ],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+            )
+        except OSError as e:
+            self.logger.error(f"❌ Failed to launch Chrome: {e}")
+            return False
+
+        deadline = time.monotonic() + config.CHROME_CONNECTION_TIMEOUT
+        while time.monotonic() < deadline:
+            if self._debug_port_ready(port):
+                return True
+            time.sleep(config.POLL_INTERVAL)
+
+        self.logger.error(f"❌ Chrome did not open debug port {port} within {config.CHROME_CONNECTION_TIMEOUT}s")
+        return False
+
     def load_game(self) -> bool:
         """
         Load the Infinite Craft game.
@@ -104,10 +205,9 @@ class BrowserService(IBrowserService):
             True if game loaded successfully, False otherwise
         """
         try:
-            game_url = "https://neal.fun/infinite-craft/"
-            self.logger.info(f"🎮 Loading game from {game_url}")
+            self.logger.info(f"🎮 Loading game from {GAME_URL}")
 
-            self.driver.get(game_url)
+            self.driver.get(GAME_URL)
 
             # Wait for game elements to load
             wait = WebDriverWait(self.driver, self._explicit_wait)
@@ -129,6 +229,15 @@ class BrowserService(IBrowserService):
         """Close browser and cleanup."""
         if self.driver:
             try:
+                if self._attached:
+                    # Stop only chromedriver; the debug Chrome stays warm for the next session
+                    self.logger.info("🔚 Detaching from browser...")
+                    self.driver.service.stop()
+                    self.driver = None
+                    self._attached = False
+                    self.logger.info("✅ Detached - Chrome left running")
+                    return
+
                 self.logger.info("🔚 Closing browser...")
                 self.driver.quit()
                 self.driver = None
@@ -167,6 +276,61 @@ class BrowserService(IBrowserService):
 
         return self.driver.execute_script(script, *args)
 
+    def wait_for_stable_dom(self, selector: str, max_wait: float, quiet_period: float = None) -> bool:
+        """
+        Wait until the subtree under a selector stops mutating.
+
+        A MutationObserver in the page resolves the wait as soon as the subtree has been
+        quiet for quiet_period, so the call costs a single round-trip and returns early
+        whenever the page settles before max_wait.
+
+        Args:
+            selector: CSS selector of the subtree to observe (document body if not found)
+            max_wait: Upper bound on the wait in seconds
+            quiet_period: Mutation-free time that counts as stable (uses POLL_INTERVAL if None)
+
+        Returns:
+            True if the subtree settled, False if max_wait elapsed first
+        """
+        from config import config
+
+        if not self.driver:
+            raise RuntimeError("Browser driver not initialized")
+
+        if quiet_period is None:
+            quiet_period = config.POLL_INTERVAL
+
+        return bool(
+            self.driver.execute_async_script(
+                """
+            var target = document.querySelector(arguments[0]) || document.body;
+            var maxMs = arguments[1], quietMs = arguments[2], done = arguments[arguments.length - 1];
+            var quietTimer = null, deadline = null, finished = false;
+
+            function finish(stable) {
+                if (finished) return;
+                finished = true;
+                observer.disconnect();
+                clearTimeout(quietTimer);
+                clearTimeout(deadline);
+                done(stable);
+            }
+
+            var observer = new MutationObserver(function() {
+                clearTimeout(quietTimer);
+                quietTimer = setTimeout(function() { finish(true); }, quietMs);
+            });
+            observer.observe(target, {childList: true, subtree: true, attributes: true, characterData: true});
+
+            quietTimer = setTimeout(function() { finish(true); }, quietMs);
+            deadline = setTimeout(function() { finish(false); }, maxMs);
+        """,
+                selector,
+                int(max_wait * 1000),
+                int(quiet_period * 1000),
+            )
+        )
+
     def get_viewport_size(self) -> Dict[str, int]:
         """
         Get browser viewport dimensions.
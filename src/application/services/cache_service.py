@@ -2,14 +2,50 @@
 
 import json
 import os
+import sqlite3
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterator, List, Optional
 
 from application.interfaces import ICacheService, ILoggingService
-from domain.models import Combination, CombinationResult, Element
+from domain.models import Combination, CombinationResult, CombinationStatus, Element
 from domain.services import CombinationLogic
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+# Bump when the journal table layout changes
+JOURNAL_SCHEMA_VERSION = 1
+
+
+def _read_cache_json(file_path: str) -> Dict:
+    """Read a cache file, with orjson when available."""
+    if ORJSON_AVAILABLE:
+        with open(file_path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(file_path, "r") as f:
+        return json.load(f)
+
+
+def _write_cache_json(file_path: str, data: Dict) -> None:
+    """
+    Write a cache file as indented JSON, with orjson when available.
+
+    Both paths produce the same layout; json.dump with indent falls back to the
+    pure-Python encoder, which dominates saving large caches.
+    """
+    if ORJSON_AVAILABLE:
+        with open(file_path, "wb") as f:
+            f.write(orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2))
+        return
+    with open(file_path, "w") as f:
+        json.dump(data, f, indent=2, default=str)
+
 
 class CacheService(ICacheService):
     """
@@ -20,18 +56,24 @@ class CacheService(ICacheService):
     - Implements proper interface for dependency injection
     - Separates file I/O from business logic
     - Better error handling and logging
+
+    Individual results are appended to a SQLite journal (WAL mode) as they are
+    recorded; the JSON file is merged and rewritten once, on save_cache().
     """
 
-    def __init__(self, file_path: str, logging_service: ILoggingService):
+    def __init__(self, file_path: str, logging_service: ILoggingService, journal_path: Optional[str] = None):
         """
         Initialize cache service.
 
         Args:
             file_path: Path to cache file for persistence
             logging_service: Service for logging operations
+            journal_path: Path to SQLite journal (defaults to file_path with a .db suffix)
         """
         self.file_path = file_path
         self.logger = logging_service
+        self.journal_path = journal_path or str(Path(file_path).with_suffix(".db"))
+        self._journal = self._open_journal(self.journal_path)
 
         # Use domain service for business logic
         self.combination_logic = CombinationLogic()
@@ -54,14 +96,17 @@ class CacheService(ICacheService):
             self.load_cache_from_file(file_path)
 
     def load_cache_from_file(self, file_path: str) -> None:
-        """Load combination cache from file with proper domain model conversion."""
+        """Load combination cache from file (plus any journaled results) with proper domain model conversion."""
         try:
+            cache_data = {}
             if os.path.exists(file_path):
                 self.logger.info(f"📥 Loading combination cache from {file_path}")
 
-                with open(file_path, "r") as f:
-                    cache_data = json.load(f)
+                cache_data = _read_cache_json(file_path)
 
+            journaled = self._merge_journal_into(cache_data)
+
+            if cache_data or journaled:
                 # Load cache data into domain service
                 self.combination_logic.load_cached_combinations_from_import(cache_data)
 
@@ -70,6 +115,7 @@ class CacheService(ICacheService):
                 self.logger.info(
                     f"✅ Cache loaded: {stats['successful']} successful, "
                     f"{stats['failed']} failed, {stats['total_tested']} total tested"
+                    + (f" ({journaled} from journal)" if journaled else "")
                 )
 
             else:
@@ -81,6 +127,81 @@ class CacheService(ICacheService):
             # Clear cache on error - combination_logic will handle this
             self.combination_logic.clear_cache()
 
+    def _open_journal(self, journal_path: str) -> Optional[sqlite3.Connection]:
+        """Open (and create if needed) the SQLite result journal, or None if unavailable."""
+        try:
+            Path(journal_path).parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(journal_path, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+
+            version = connection.execute("PRAGMA user_version").fetchone()[0]
+            if version not in (0, JOURNAL_SCHEMA_VERSION):
+                self.logger.warning(f"⚠️ Journal schema v{version} not supported - starting a fresh journal")
+                connection.execute("DROP TABLE IF EXISTS combinations")
+
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS combinations (
+                    cache_key TEXT PRIMARY KEY,
+                    status TEXT NOT NULL,
+                    result TEXT
+                )
+            """
+            )
+            connection.execute(f"PRAGMA user_version={JOURNAL_SCHEMA_VERSION}")
+            return connection
+
+        except Exception as e:
+            self.logger.warning(f"⚠️ Could not open cache journal {journal_path}, saving JSON per result: {e}")
+            return None
+
+    def _merge_journal_into(self, cache_data: Dict) -> int:
+        """Merge journaled results into cache_data (JSON cache layout). Returns number of rows merged."""
+        if self._journal is None:
+            return 0
+
+        rows = self._journal.execute("SELECT cache_key, status, result FROM combinations").fetchall()
+        if not rows:
+            return 0
+
+        successful = cache_data.setdefault("successful", {})
+        failed = set(cache_data.get("failed", []))
+        tested = set(cache_data.get("tested", []))
+
+        for cache_key, status, result in rows:
+            tested.add(cache_key)
+            if status == "success" and result:
+                successful[cache_key] = json.loads(result)
+                failed.discard(cache_key)
+            elif status == "failed":
+                failed.add(cache_key)
+
+        cache_data["failed"] = list(failed)
+        cache_data["tested"] = list(tested)
+        return len(rows)
+
+    def _journal_result(self, result: CombinationResult) -> None:
+        """Write one recorded result to the journal."""
+        cache_key = result.combination.cache_key
+
+        if result.status == CombinationStatus.SUCCESS and result.result_element:
+            self._journal.execute(
+                "INSERT OR REPLACE INTO combinations (cache_key, status, result) VALUES (?, 'success', ?)",
+                (cache_key, json.dumps(result.result_element.to_dict(), default=str)),
+            )
+        elif result.status == CombinationStatus.NO_RESULT:
+            self._journal.execute(
+                "INSERT OR REPLACE INTO combinations (cache_key, status, result) VALUES (?, 'failed', NULL)",
+                (cache_key,),
+            )
+        else:
+            # Errors/drag failures only mark the pair tested; never downgrade a known outcome
+            self._journal.execute(
+                "INSERT OR IGNORE INTO combinations (cache_key, status, result) VALUES (?, 'tested', NULL)",
+                (cache_key,),
+            )
+
     def save_cache_to_file(self, file_path: str) -> None:
         """Save combination cache to file, merging with existing cache data."""
         try:
@@ -92,12 +213,11 @@ class CacheService(ICacheService):
             existing_cache = {}
             if cache_path.exists():
                 try:
-                    with open(file_path, "r") as f:
-                        existing_cache = json.load(f)
-                        self.logger.debug(
-                            f"📥 Loaded existing cache for merging: {
-                                len(existing_cache.get('successful', {}))} successful"
-                        )
+                    existing_cache = _read_cache_json(file_path)
+                    self.logger.debug(
+                        f"📥 Loaded existing cache for merging: {
+                            len(existing_cache.get('successful', {}))} successful"
+                    )
                 except Exception as e:
                     self.logger.warning(f"⚠️ Could not load existing cache for merging: {e}")
                     existing_cache = {}
@@ -148,8 +268,11 @@ class CacheService(ICacheService):
             )
 
             # Save merged cache
-            with open(file_path, "w") as f:
-                json.dump(merged_cache, f, indent=2, default=str)
+            _write_cache_json(file_path, merged_cache)
+
+            # The JSON file now holds every journaled result, so the journal can start over
+            if os.path.abspath(file_path) == os.path.abspath(self.file_path):
+                self._clear_journal()
 
             self.logger.info(
                 f"💾 Cache merged and saved: {len(merged_cache['successful'])} successful, {
@@ -163,6 +286,28 @@ class CacheService(ICacheService):
         """Save cache using the default file path."""
         self.save_cache_to_file(self.file_path)
 
+    def _clear_journal(self) -> None:
+        """Empty the journal after its results were merged into the JSON cache, shrinking the WAL file too."""
+        if self._journal is None:
+            return
+
+        try:
+            self._journal.execute("DELETE FROM combinations")
+            self._journal.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        except Exception as e:
+            self.logger.warning(f"⚠️ Could not clear cache journal: {e}")
+
+    def close(self) -> None:
+        """Close the journal connection; later results are saved straight to the JSON cache."""
+        if self._journal is None:
+            return
+
+        try:
+            self._journal.close()
+        except Exception as e:
+            self.logger.warning(f"⚠️ Could not close cache journal: {e}")
+        self._journal = None
+
     def is_combination_tested(self, combination: Combination) -> bool:
         """Check if combination has been tested."""
         return self.combination_logic.is_combination_tested(combination)
@@ -183,7 +328,7 @@ class CacheService(ICacheService):
         """
         Record the result of a combination attempt.
 
-        Updates internal cache and saves to file immediately.
+        Updates internal cache and journals the result immediately.
         """
         # Record in domain service
         self.combination_logic.record_combination_result(result)
@@ -201,7 +346,14 @@ class CacheService(ICacheService):
         else:
             self.logger.info(f"💾 CACHED FAILURE: {result.combination.cache_key} → No result")
 
-        # Save to file immediately (matches original behavior)
+        # Persist immediately: one journal row instead of rewriting the whole JSON cache
+        if self._journal is not None:
+            try:
+                self._journal_result(result)
+                return
+            except Exception as e:
+                self.logger.warning(f"⚠️ Journal write failed, saving JSON instead: {e}")
+
         self.save_cache_to_file(self.file_path)
 
     def get_cache_stats(self) -> Dict[str, int]:
@@ -236,6 +388,16 @@ class CacheService(ICacheService):
         """Get all untested combinations from available elements."""
         return self.combination_logic.get_untested_combinations(available_elements)
 
+    def iter_untested_combinations(self, available_elements: List[Element]) -> Iterator[Combination]:
+        """Lazily yield untested combinations from available elements."""
+        return self.combination_logic.iter_untested_combinations(available_elements)
+
+    def iter_untested_combinations_with(
+        self, new_elements: List[Element], existing_elements: List[Element]
+    ) -> Iterator[Combination]:
+        """Lazily yield untested combinations involving newly discovered elements."""
+        return self.combination_logic.iter_untested_combinations_with(new_elements, existing_elements)
+
     def should_skip_combination(self, combination: Combination, available_elements: List[Element]) -> Optional[str]:
         """
         Check if combination should be skipped with reason.
@@ -248,17 +410,8 @@ class CacheService(ICacheService):
 
     def is_combination_tested_by_names(self, elem1_name: str, elem2_name: str) -> bool:
         """Backward compatibility: Check if combination is tested using element names."""
-        # This would require converting names to elements, but for migration we can use
-        # the original cache key approach
         cache_key = "+".join(sorted([elem1_name.lower(), elem2_name.lower()]))
-
-        # Get tested combinations and do EXACT matching (not substring)
-        tested_keys = set()
-        for combo_key in self.combination_logic._tested_combinations:
-            tested_keys.add(str(combo_key))
-
-        # Check for exact match
-        is_tested = cache_key in tested_keys
+        is_tested = self.combination_logic.is_tested_by_names(elem1_name, elem2_name)
 
         if is_tested:
             self.logger.debug(f"✅ Found exact cache match for: {cache_key}")
@@ -267,17 +420,39 @@ class CacheService(ICacheService):
 
         return is_tested
 
+    def get_tested_names_checker(self) -> Callable[[str, str], bool]:
+        """
+        Get a (name1, name2) -> tested check for filtering many pairs at once.
+
+        Unlike is_combination_tested_by_names, names are resolved once per checker
+        and nothing is logged per pair.
+        """
+        return self.combination_logic.tested_names_checker()
+
     def create_combination_from_names(
         self, elem1_name: str, elem2_name: str, available_elements: List[Element]
     ) -> Optional[Combination]:
         """Helper to create Combination from names using available elements."""
-        elem1 = next((e for e in available_elements if e.matches_name(elem1_name)), None)
-        elem2 = next((e for e in available_elements if e.matches_name(elem2_name)), None)
+        # One pass over the elements, normalizing the wanted names once
+        key1, key2 = elem1_name.lower().strip(), elem2_name.lower().strip()
+        elem1 = elem2 = None
+        for element in available_elements:
+            key = element.cache_key
+            if elem1 is None and key == key1:
+                elem1 = element
+            if elem2 is None and key == key2:
+                elem2 = element
+            if elem1 and elem2:
+                break
 
         if elem1 and elem2:
-            try:
-                return self.combination_logic.create_combination(elem1, elem2)
-            except ValueError:
-                # Invalid combination (e.g., same element)
-                return None
+            return self.create_combination(elem1, elem2)
         return None
+
+    def create_combination(self, elem1: Element, elem2: Element) -> Optional[Combination]:
+        """Create a validated Combination, or None if the game rules don't allow it."""
+        try:
+            return self.combination_logic.create_combination(elem1, elem2)
+        except ValueError:
+            # Invalid combination (e.g., same element)
+            return None
@@ -6,6 +6,9 @@ from application.interfaces import ILoggingService
 from domain.models import Combination, CombinationResult, Element
 from domain.services import GameMechanics
 
+# Upper bound for the first dragged element to show up in the workspace
+FIRST_ELEMENT_MAX_WAIT = 0.5
+
 
 class CombinationService:
     """
@@ -75,7 +78,7 @@ class CombinationService:
             initial_workspace = self.workspace_manager.get_workspace_elements()
 
             # Step 3: Drag first element to workspace
-            self.logger.info(f"🎯 Testing: {combination.display_name}")
+            self.logger.info("🎯 Testing: %s", combination.display_name)
 
             drag1_success = self.drag_handler.drag_element_to_workspace(
                 combination.element1.name, target_location.x, target_location.y, self.element_detector
@@ -85,18 +88,17 @@ class CombinationService:
                 self.logger.warning(f"❌ Failed to drag {combination.element1.name} to workspace")
                 return CombinationResult.drag_failed(combination, "First element drag failed")
 
-            # Step 4: Wait and get first element's actual position
-            import time
-
-            time.sleep(0.5)  # Brief wait for element to appear
-
-            workspace_after_first = self.workspace_manager.get_workspace_elements()
+            # Step 4: Wait (briefly) for the first element to land and get its actual position
+            workspace_after_first = self.workspace_manager.wait_for_workspace_growth(
+                len(initial_workspace), FIRST_ELEMENT_MAX_WAIT
+            )
 
             merge_target_x, merge_target_y = self._find_first_element_position(
                 initial_workspace, workspace_after_first, target_location, combination.element1.name
             )
 
             # Step 5: Drag second element ONTO first element
+            sidebar_count = self.element_detector.count_sidebar_items()
 
             drag2_success = self.drag_handler.drag_element_to_workspace(
                 combination.element2.name, merge_target_x, merge_target_y, self.element_detector
@@ -106,8 +108,8 @@ class CombinationService:
                 self.logger.warning(f"❌ Failed to drag {combination.element2.name} to workspace")
                 return CombinationResult.drag_failed(combination, "Second element drag failed")
 
-            # Step 6: Wait for merge and detect results
-            time.sleep(GameMechanics.get_merge_timeout())
+            # Step 6: Wait for merge (returns early once a new element reaches the sidebar) and detect results
+            self.element_detector.wait_for_new_sidebar_element(sidebar_count, GameMechanics.get_merge_timeout())
 
             return self._evaluate_combination_result(combination, available_elements)
 
@@ -131,7 +133,7 @@ class CombinationService:
             Tuple of (x, y) coordinates for merge target
         """
         merge_target_x, merge_target_y = target_location.x, target_location.y
-        self.logger.debug(f"🎯 STEP 2: Initial merge target: ({merge_target_x}, {merge_target_y})")
+        self.logger.debug("🎯 STEP 2: Initial merge target: (%s, %s)", merge_target_x, merge_target_y)
 
         if len(workspace_after_first) > len(initial_workspace):
             self.logger.debug("🔍 More elements found after first drag - looking for first element's actual position")
@@ -145,18 +147,21 @@ class CombinationService:
                 merge_target_x = newest_element.position.x
                 merge_target_y = newest_element.position.y
                 self.logger.debug(
-                    "🎯 FOUND 1ST ELEMENT: "
-                    f"{newest_element.element.display_name} at ({merge_target_x}, {merge_target_y})"
+                    "🎯 FOUND 1ST ELEMENT: %s at (%s, %s)",
+                    newest_element.element.display_name,
+                    merge_target_x,
+                    merge_target_y,
                 )
                 self.logger.debug("🎯 Will drag 2nd element ONTO this position!")
             else:
                 self.logger.debug(
-                    f"🎯 No new elements by name comparison - using original target: "
-                    f"({merge_target_x}, {merge_target_y})"
+                    "🎯 No new elements by name comparison - using original target: (%s, %s)",
+                    merge_target_x,
+                    merge_target_y,
                 )
         else:
             self.logger.debug(
-                f"🎯 No new elements detected - using original target: ({merge_target_x}, {merge_target_y})"
+                "🎯 No new elements detected - using original target: (%s, %s)", merge_target_x, merge_target_y
             )
 
         return merge_target_x, merge_target_y
@@ -184,9 +189,9 @@ class CombinationService:
 
             if new_elements:
                 new_element = new_elements[0]  # Take the first new element
-                self.logger.info(f"🎉 SUCCESS! {combination.display_name} → {new_element.display_name}")
+                self.logger.info("🎉 SUCCESS! %s → %s", combination.display_name, new_element.display_name)
                 return CombinationResult.success(combination, new_element)
 
         # No new elements - combination attempted but no result
-        self.logger.debug(f"⚪ No new elements: {combination.display_name} (combination attempted)")
+        self.logger.debug("⚪ No new elements: %s (combination attempted)", combination.display_name)
         return CombinationResult.no_result(combination)
@@ -51,13 +51,21 @@ class DragService:
         try:
             self.logger.debug("🎯 PRE-DRAG: Starting smooth drag operation")
 
-            # Get fresh source position using getBoundingClientRect for consistency
+            # Get fresh source position and what sits under it in a single round-trip
             fresh_source_center = self.browser.execute_script(
                 """
                 const rect = arguments[0].getBoundingClientRect();
+                const x = rect.left + rect.width / 2;
+                const y = rect.top + rect.height / 2;
+                const hovered = document.elementFromPoint(x, y);
                 return {
-                    x: rect.left + rect.width / 2,
-                    y: rect.top + rect.height / 2
+                    x: x,
+                    y: y,
+                    hover: hovered ? {
+                        tagName: hovered.tagName,
+                        className: hovered.className || '',
+                        textContent: (hovered.textContent || '').substring(0, 20)
+                    } : null
                 };
             """,
                 source_element,
@@ -79,28 +87,12 @@ class DragService:
             if steps is None:
                 steps = GameMechanics.calculate_drag_steps(distance)
 
-            self.logger.debug(f"📍 COORDS: Start ({start_x:.0f},{start_y:.0f}) → Target ({target_x},{target_y})")
-            self.logger.debug(f"📏 Distance: {distance:.1f}px, Steps: {steps}")
+            self.logger.debug("📍 COORDS: Start (%.0f,%.0f) → Target (%s,%s)", start_x, start_y, target_x, target_y)
+            self.logger.debug("📏 Distance: %.1fpx, Steps: %s", distance, steps)
 
             # Log what element we're hovering (debugging info)
-            try:
-                hovered_element = self.browser.execute_script(
-                    "return document.elementFromPoint(arguments[0], arguments[1]);", start_x, start_y
-                )
-                if hovered_element:
-                    hover_info = self.browser.execute_script(
-                        """
-                        return {
-                            tagName: arguments[0].tagName,
-                            className: arguments[0].className || '',
-                            textContent: (arguments[0].textContent || '').substring(0, 20)
-                        };
-                    """,
-                        hovered_element,
-                    )
-                    self.logger.debug(f"🎯 HOVERED: {hover_info}")
-            except Exception:
-                pass  # Non-critical debugging info
+            if fresh_source_center.get("hover"):
+                self.logger.debug("🎯 HOVERED: %s", fresh_source_center["hover"])
 
             # Perform smooth drag with ActionChains
             action_chains = ActionChains(self.browser.driver)
@@ -109,16 +101,12 @@ class DragService:
             action_chains.move_to_element(source_element)
             action_chains.click_and_hold()
 
-            # Calculate step increments
-            step_x = (target_x - start_x) / steps if steps > 0 else 0
-            step_y = (target_y - start_y) / steps if steps > 0 else 0
-
-            # Perform smooth movement
-            for i in range(1, steps + 1):
-                start_x + (step_x * i)
-                start_y + (step_y * i)
-
-                action_chains.move_by_offset(step_x, step_y)
+            # Eased path with integer offsets so rounding never drifts off the drop point
+            path = self.calculate_drag_path(start_pos, target_pos, steps)
+            prev_x, prev_y = start_pos.x, start_pos.y
+            for i, (x, y) in enumerate(path, start=1):
+                action_chains.move_by_offset(x - prev_x, y - prev_y)
+                prev_x, prev_y = x, y
 
                 if i < steps:  # Don't pause after the final step
                     action_chains.pause(GameMechanics.DRAG_HOLD_DURATION)
@@ -131,7 +119,7 @@ class DragService:
             action_chains.perform()
             execution_time = time.time() - start_time
 
-            self.logger.info(f"⚡ Fast drag completed in {execution_time:.3f}s")
+            self.logger.info("⚡ Fast drag completed in %.3fs", execution_time)
             return True
 
         except Exception as e:
@@ -162,7 +150,7 @@ class DragService:
             return False
 
         try:
-            self.logger.debug(f"🎯 Dragging '{element_name}' to workspace ({workspace_x}, {workspace_y})")
+            self.logger.debug("🎯 Dragging '%s' to workspace (%s, %s)", element_name, workspace_x, workspace_y)
 
             # Find element in sidebar
             source_element = element_detection_service.find_element_by_name(element_name)
@@ -179,7 +167,7 @@ class DragService:
             success = self.smooth_drag_element(source_element, workspace_x, workspace_y)
 
             if success:
-                self.logger.debug(f"✅ Successfully dragged '{element_name}' to workspace")
+                self.logger.debug("✅ Successfully dragged '%s' to workspace", element_name)
             else:
                 self.logger.warning(f"❌ Failed to drag '{element_name}' to workspace")
 
@@ -191,7 +179,7 @@ class DragService:
 
     def calculate_drag_path(self, start: ElementPosition, end: ElementPosition, steps: int) -> list[Tuple[int, int]]:
         """
-        Calculate intermediate points for smooth drag path.
+        Calculate intermediate points for smooth drag path, cubic-eased.
 
         Args:
             start: Starting position
@@ -205,13 +193,12 @@ class DragService:
             return [(end.x, end.y)]
 
         path = []
-        step_x = (end.x - start.x) / steps
-        step_y = (end.y - start.y) / steps
+        dx = end.x - start.x
+        dy = end.y - start.y
 
         for i in range(1, steps + 1):
-            x = int(start.x + (step_x * i))
-            y = int(start.y + (step_y * i))
-            path.append((x, y))
+            t = GameMechanics.ease_in_out_cubic(i / steps)
+            path.append((round(start.x + dx * t), round(start.y + dy * t)))
 
         return path
 
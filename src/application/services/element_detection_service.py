@@ -6,6 +6,47 @@ from selenium.webdriver.remote.webelement import WebElement
 
 from application.interfaces import IBrowserService, ILoggingService
 from domain.models import Element, ElementSource
+from domain.services import GameMechanics
+
+# Cheap in-page digest of the sidebar (count + FNV-1a over ids and texts) to detect "nothing changed"
+SIDEBAR_FINGERPRINT_JS = """
+var items = document.querySelectorAll('#sidebar .item');
+var hash = 2166136261;
+for (var i = 0; i < items.length; i++) {
+    var text = (items[i].getAttribute('data-item-id') || '') + '|' + (items[i].textContent || '') + '\\n';
+    for (var j = 0; j < text.length; j++) {
+        hash ^= text.charCodeAt(j);
+        hash = Math.imul(hash, 16777619);
+    }
+}
+return items.length + ':' + (hash >>> 0);
+"""
+
+# Emoji that the sidebar renders alongside element names
+ITEM_TEXT_EMOJI = (
+    "✈️🔥💧🌬️🌍🌱💨☁️🌧️⚡️🐊🪲🕯️🌫️☀️💩⛈️🌋🦟🦎🔪🦖🥘🌪️🌿🌈🦄🌊🪨🎭🎨🎪🎺🎻🎸🎤🎧🎮🎯🎲"
+    "🎳🎰🃏🎴🀄🎊🎉🎈🎁🎀🎗️🎟️🎫🎪⭐✨💫⚡🔥❄️☀️🌟💥💢💦💧🌊🌈☁️⛅⛈️🌤️🌦️🌧️⚆⚇⚈⚉"
+)
+
+
+def _clean_item_text(raw_text: str) -> str:
+    """
+    Get the element name from a sidebar item's raw text.
+
+    Removes newlines and emoji, keeping only words with alphabetic characters.
+    """
+    clean_text = raw_text.replace("\n", " ").strip()
+
+    words = []
+    for word in clean_text.split():
+        # Keep words that have alphabetic characters
+        if any(c.isalpha() for c in word):
+            # Remove leading/trailing non-alphabetic chars but keep internal ones
+            cleaned_word = word.strip(ITEM_TEXT_EMOJI + " \t\n\r")
+            if cleaned_word and any(c.isalpha() for c in cleaned_word):
+                words.append(cleaned_word)
+
+    return " ".join(words) if words else clean_text
 
 
 class ElementDetectionService:
@@ -37,6 +78,7 @@ class ElementDetectionService:
 
         # Tracking metadata
         self.last_update_count = 0
+        self._sidebar_fingerprint: Optional[str] = None
 
     def initialize_sidebar_tracking(self) -> bool:
         """Initialize sidebar element tracking and caching."""
@@ -65,48 +107,36 @@ class ElementDetectionService:
             List of Element domain models
         """
         try:
-            element_web_objects = self.browser.find_elements_by_css("#sidebar .item")
+            # Skip the per-item scan when the sidebar is identical to the last one parsed
+            fingerprint = self.browser.execute_script(SIDEBAR_FINGERPRINT_JS)
+            if fingerprint == self._sidebar_fingerprint and self.sidebar_elements:
+                return list(self.sidebar_elements)
+
+            # Read every item's data in one script instead of one round-trip per item
+            sidebar_data = self.browser.execute_script(
+                """
+                var items = document.querySelectorAll('#sidebar .item');
+                var data = [];
+                for (var i = 0; i < items.length; i++) {
+                    var elem = items[i];
+                    data.push({
+                        name: elem.textContent || elem.innerText || '',
+                        emoji: elem.getAttribute('data-emoji') || '',
+                        id: elem.getAttribute('data-item-id') || '',
+                        dataItemText: elem.getAttribute('data-item-text') || '',
+                        index: i,
+                        discovered: elem.getAttribute('data-discovered') || null
+                    });
+                }
+                return data;
+            """
+            )
             elements = []
 
-            for index, elem_web in enumerate(element_web_objects):
+            for index, element_data in enumerate(sidebar_data):
                 try:
-                    # Extract element data using JavaScript (matches original utils.py approach)
-                    element_data = self.browser.execute_script(
-                        """
-                        var elem = arguments[0];
-                        return {
-                            name: elem.textContent || elem.innerText || '',
-                            emoji: elem.getAttribute('data-emoji') || '',
-                            id: elem.getAttribute('data-item-id') || '',
-                            dataItemText: elem.getAttribute('data-item-text') || '',
-                            index: arguments[1],
-                            discovered: elem.getAttribute('data-discovered') || null
-                        };
-                    """,
-                        elem_web,
-                        index,
-                    )
-
                     # Create domain model with proper text cleaning
-                    raw_name = element_data["name"] or ""
-                    # Clean element name: remove newlines, extra spaces
-                    clean_name = raw_name.replace("\n", " ").strip()
-
-                    # Remove emoji and extra spaces more robustly
-                    # Split by spaces and take only alphabetic words
-                    words = []
-                    for word in clean_name.split():
-                        # Keep words that have alphabetic characters
-                        if any(c.isalpha() for c in word):
-                            # Remove leading/trailing non-alphabetic chars but keep internal ones
-                            cleaned_word = word.strip(
-                                "✈️🔥💧🌬️🌍🌱💨☁️🌧️⚡️🐊🪲🕯️🌫️☀️💩⛈️🌋🦟🦎🔪🦖🥘🌪️🌿🌈🦄🌊🪨🎭🎨🎪🎺🎻🎸🎤🎧🎮🎯🎲"
-                                "🎳🎰🃏🎴🀄🎊🎉🎈🎁🎀🎗️🎟️🎫🎪⭐✨💫⚡🔥❄️☀️🌟💥💢💦💧🌊🌈☁️⛅⛈️🌤️🌦️🌧️⚆⚇⚈⚉" + " \t\n\r"
-                            )
-                            if cleaned_word and any(c.isalpha() for c in cleaned_word):
-                                words.append(cleaned_word)
-
-                    clean_name = " ".join(words) if words else clean_name
+                    clean_name = _clean_item_text(element_data["name"] or "")
 
                     element = Element(
                         name=clean_name,
@@ -126,14 +156,44 @@ class ElementDetectionService:
             # Update internal tracking
             self.sidebar_elements = elements
             self._update_sidebar_cache()
+            self._sidebar_fingerprint = fingerprint
 
-            self.logger.debug(f"📊 Detected {len(elements)} sidebar elements")
+            self.logger.debug("📊 Detected %s sidebar elements", len(elements))
             return elements
 
         except Exception as e:
             self.logger.error(f"❌ Failed to get sidebar elements: {e}")
             return []
 
+    def count_sidebar_items(self) -> int:
+        """Count raw sidebar items in the page without reading their contents."""
+        return self.browser.execute_script("return document.querySelectorAll('#sidebar .item').length;")
+
+    def wait_for_new_sidebar_element(self, previous_count: int, max_wait: float) -> bool:
+        """
+        Poll the sidebar item count until it grows, up to max_wait.
+
+        Args:
+            previous_count: Raw sidebar item count before the combination (from count_sidebar_items)
+            max_wait: Maximum wait time in seconds
+
+        Returns:
+            True if the sidebar grew before the deadline
+        """
+        import time
+
+        deadline = time.time() + max_wait
+        while True:
+            try:
+                if self.count_sidebar_items() > previous_count:
+                    return True
+            except Exception as e:
+                self.logger.debug(f"❌ Sidebar count probe failed: {e}")
+
+            if time.time() >= deadline:
+                return False
+            time.sleep(GameMechanics.POLL_INTERVAL)
+
     def _update_sidebar_cache(self) -> None:
         """Update the sidebar cache with current elements."""
         self.sidebar_cache.clear()
@@ -159,7 +219,7 @@ class ElementDetectionService:
             # Check for changes
             new_count = len(current_elements)
             if new_count != old_count:
-                self.logger.debug(f"📊 Sidebar updated: {old_count} → {new_count} elements")
+                self.logger.debug("📊 Sidebar updated: %s → %s elements", old_count, new_count)
                 return True
             else:
                 self.logger.debug("📊 Sidebar unchanged")
@@ -191,37 +251,32 @@ class ElementDetectionService:
                 self.logger.debug(f"❌ Element '{element_name}' not found in sidebar cache")
                 return None
 
-            # Find fresh WebElement by text content (avoids stale element issues)
-            sidebar_elements = self.browser.find_elements_by_css("#sidebar .item")
+            target_name = element_name.lower()
+
+            # Fresh WebElement at the cached sidebar position, with its text to confirm it in the same call
+            if element.sidebar_index is not None:
+                match = self.browser.execute_script(
+                    """
+                    var item = document.querySelectorAll('#sidebar .item')[arguments[0]];
+                    return item ? [item, item.textContent || ''] : null;
+                """,
+                    element.sidebar_index,
+                )
+                if match and _clean_item_text(match[1]).lower() == target_name:
+                    return match[0]
+
+            # Sidebar changed since the cache was built: fetch all items with their text in one call
+            sidebar_elements, raw_texts = self.browser.execute_script(
+                """
+                var items = Array.prototype.slice.call(document.querySelectorAll('#sidebar .item'));
+                return [items, items.map(function(item) { return item.textContent || ''; })];
+            """
+            )
 
-            for web_elem in sidebar_elements:
-                try:
-                    raw_text = web_elem.text.strip()
-                    # Clean element text same way as in get_sidebar_elements
-                    clean_text = raw_text.replace("\n", " ").strip()
-
-                    # Remove emoji and extra spaces robustly - same logic as above
-                    words = []
-                    for word in clean_text.split():
-                        if any(c.isalpha() for c in word):
-                            cleaned_word = word.strip(
-                                "✈️🔥💧🌬️🌍🌱💨☁️🌧️⚡️🐊🪲🕯️🌫️☀️💩⛈️🌋🦟🦎🔪🦖🥘🌪️🌿🌈🦄🌊🪨🎭🎨🎪🎺🎻🎸🎤🎧🎮🎯🎲"
-                                "🎳🎰🃏🎴🀄🎊🎉🎈🎁🎀🎗️🎟️🎫🎪⭐✨💫⚡🔥❄️☀️🌟💥💢💦💧🌊🌈☁️⛅⛈️🌤️🌦️🌧️⚆⚇⚈⚉" + " \t\n\r"
-                            )
-                            if cleaned_word and any(c.isalpha() for c in cleaned_word):
-                                words.append(cleaned_word)
-
-                    clean_text = " ".join(words) if words else clean_text
-
-                    if clean_text.lower() == element_name.lower():
-                        return web_elem
-
-                    # Try partial match if exact match fails
-                    if element_name.lower() in clean_text.lower():
-                        return web_elem
-
-                except Exception:
-                    continue
+            for web_elem, raw_text in zip(sidebar_elements, raw_texts):
+                # Exact or partial name match
+                if target_name in _clean_item_text(raw_text).lower():
+                    return web_elem
 
             self.logger.debug(f"❌ WebElement for '{element_name}' not found in DOM")
             return None
@@ -241,24 +296,14 @@ class ElementDetectionService:
             True if element is visible, False otherwise
         """
         try:
-            # Get viewport info for bounds checking
-            viewport = self.browser.get_viewport_size()
-
-            # Scroll element into view
-            self.browser.execute_script(
+            # Scroll into view and measure in one round-trip
+            element_rect = self.browser.execute_script(
                 """
                 arguments[0].scrollIntoView({
                     behavior: 'instant',
                     block: 'center',
                     inline: 'center'
                 });
-            """,
-                element,
-            )
-
-            # Check if element is within viewport bounds
-            element_rect = self.browser.execute_script(
-                """
                 const rect = arguments[0].getBoundingClientRect();
                 return {
                     x: rect.left,
@@ -266,7 +311,9 @@ class ElementDetectionService:
                     width: rect.width,
                     height: rect.height,
                     right: rect.right,
-                    bottom: rect.bottom
+                    bottom: rect.bottom,
+                    viewportWidth: window.innerWidth,
+                    viewportHeight: window.innerHeight
                 };
             """,
                 element,
@@ -276,20 +323,34 @@ class ElementDetectionService:
             if (
                 element_rect["x"] < 0
                 or element_rect["y"] < 0
-                or element_rect["right"] > viewport["width"]
-                or element_rect["bottom"] > viewport["height"]
+                or element_rect["right"] > element_rect["viewportWidth"]
+                or element_rect["bottom"] > element_rect["viewportHeight"]
             ):
 
                 self.logger.debug(f"⚠️ Element outside viewport: {element_rect}")
                 return False
 
-            self.logger.debug(f"✅ Element visible at ({element_rect['x']:.0f}, {element_rect['y']:.0f})")
+            self.logger.debug("✅ Element visible at (%.0f, %.0f)", element_rect["x"], element_rect["y"])
             return True
 
         except Exception as e:
             self.logger.error(f"❌ Failed to ensure element visibility: {e}")
             return False
 
+    def get_known_sidebar_elements(self) -> List[Element]:
+        """
+        Get the sidebar elements from the last scan, scanning only if there hasn't been one.
+
+        Every combination rescans the sidebar when evaluating its result, so between
+        combinations this is already the current sidebar without another round-trip.
+
+        Returns:
+            List of Element domain models
+        """
+        if not self.sidebar_elements:
+            return self.get_sidebar_elements()
+        return list(self.sidebar_elements)
+
     def get_element_count(self) -> int:
         """Get current count of sidebar elements."""
         return len(self.sidebar_elements)
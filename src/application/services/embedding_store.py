@@ -0,0 +1,117 @@
+"""Word embeddings stored as rows of one contiguous matrix."""
+
+from typing import Dict, Iterable, Iterator, List, Optional
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
+
+
+class EmbeddingStore:
+    """
+    Mapping of word -> embedding backed by a single (N, d) float32 matrix.
+
+    Lookups behave like a dict of vectors, but every embedding is a row view of
+    the same buffer, so many words can be gathered for a matmul with one fancy
+    index instead of stacking separately allocated arrays.
+    """
+
+    MIN_CAPACITY = 64
+
+    def __init__(self, matrix: Optional["np.ndarray"] = None, words: Iterable[str] = ()):
+        """
+        Initialize store.
+
+        Args:
+            matrix: Optional (N, d) embeddings to start from, e.g. a read-only memory map
+            words: The word for each row of matrix
+        """
+        self._rows: Dict[str, int] = {word: row for row, word in enumerate(words)}
+        self._matrix = matrix  # Capacity may exceed len(self); rows past it are unused
+        if matrix is not None and len(matrix) != len(self._rows):
+            raise ValueError(f"{len(self._rows)} words given for {len(matrix)} embedding rows")
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self._rows
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._rows)
+
+    def get(self, word: str) -> Optional["np.ndarray"]:
+        """Get a read-only view of a word's embedding, or None if it isn't stored."""
+        row = self._rows.get(word)
+        if row is None:
+            return None
+        embedding = self._matrix[row]
+        embedding.flags.writeable = False  # Shares the store's buffer
+        return embedding
+
+    def __getitem__(self, word: str) -> "np.ndarray":
+        embedding = self.get(word)
+        if embedding is None:
+            raise KeyError(word)
+        return embedding
+
+    def __setitem__(self, word: str, embedding) -> None:
+        self.update([word], [embedding])
+
+    def update(self, words: List[str], embeddings) -> None:
+        """
+        Store several embeddings, replacing any existing ones for the same words.
+
+        Args:
+            words: Words to store
+            embeddings: One vector per word, as a sequence or an (len(words), d) array
+        """
+        if not words:
+            return
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+
+        rows = []
+        for word in words:
+            row = self._rows.get(word)
+            if row is None:
+                row = self._rows[word] = len(self._rows)
+            rows.append(row)
+
+        self._reserve(len(self._rows), embeddings.shape[1])
+        self._matrix[rows] = embeddings
+
+    def _reserve(self, size: int, dimensions: int) -> None:
+        """Make the matrix writable with room for size rows, doubling its capacity when it grows."""
+        matrix = self._matrix
+        if matrix is not None and matrix.flags.writeable and len(matrix) >= size:
+            return
+
+        current = 0 if matrix is None else len(matrix)
+        capacity = max(size, current, self.MIN_CAPACITY)
+        if current < size:
+            capacity = max(capacity, 2 * current)
+        grown = np.empty((capacity, dimensions), dtype=np.float32)
+        if matrix is not None:
+            grown[: len(matrix)] = matrix  # Also copies a read-only memory map into memory
+        self._matrix = grown
+
+    @property
+    def words(self) -> List[str]:
+        """Stored words in row order."""
+        return list(self._rows)
+
+    @property
+    def matrix(self) -> "np.ndarray":
+        """The stored embeddings as an (N, d) view, one row per word in row order."""
+        if self._matrix is None:
+            return np.empty((0, 0), dtype=np.float32)
+        return self._matrix[: len(self._rows)]
+
+    def rows_for(self, words: Iterable[str]) -> "np.ndarray":
+        """Get the matrix row of each word (all must be stored), to gather them with one index."""
+        rows = self._rows
+        return np.fromiter((rows[word] for word in words), dtype=np.intp)
@@ -1,11 +1,16 @@
 """Logging service implementation."""
 
+import atexit
 import functools
+import sys
 import time
 from datetime import datetime
 
 from application.interfaces import ILoggingService
 
+# Icons shown for each level (if terminal supports it)
+LEVEL_ICONS = {"DEBUG": "🔍", "INFO": "ℹ️", "WARNING": "⚠️", "ERROR": "❌"}
+
 
 class LoggingService(ILoggingService):
     """
@@ -13,53 +18,90 @@ class LoggingService(ILoggingService):
 
     Provides enhanced logging with timestamps and levels.
     Includes timing functionality for performance monitoring.
+
+    Lines can be buffered and written in batches; warnings and errors always
+    flush straight away so problems are never delayed.
     """
 
-    def __init__(self, log_level: str = "INFO"):
+    def __init__(self, log_level: str = "INFO", buffer_size: int = 1, flush_interval: float = 1.0):
         """
         Initialize logging service.
 
         Args:
             log_level: Minimum log level to output (DEBUG, INFO, WARNING, ERROR)
+            buffer_size: Lines to hold before writing (1 writes every line immediately)
+            flush_interval: Seconds after the last write at which the next log call writes the buffer
         """
         self.log_level = log_level.upper()
         self._level_hierarchy = {"DEBUG": 0, "INFO": 1, "WARNING": 2, "ERROR": 3}
-
-    def log(self, level: str, message: str) -> None:
-        """Log a message at the specified level."""
-        level = level.upper()
+        self._min_level = self._level_hierarchy.get(self.log_level, 1)
+
+        self.buffer_size = max(buffer_size, 1)
+        self.flush_interval = flush_interval
+        self._buffer = []
+        self._last_flush = time.monotonic()
+        if self.buffer_size > 1:
+            atexit.register(self.flush)
+
+    def log(self, level: str, message: str, *args) -> None:
+        """Log a message at the specified level, %-formatting it with args only if it will be output."""
+        severity = self._level_hierarchy.get(level)
+        if severity is None:
+            level = level.upper()
+            severity = self._level_hierarchy.get(level, 1)
 
         # Check if level should be logged
-        if self._level_hierarchy.get(level, 1) < self._level_hierarchy.get(self.log_level, 1):
+        if severity < self._min_level:
             return
 
+        if args:
+            message = message % args
+
         # Create timestamp
         timestamp = datetime.now().strftime("%H:%M:%S")
 
-        # Color coding for different levels (if terminal supports it)
-        level_colors = {"DEBUG": "🔍", "INFO": "ℹ️", "WARNING": "⚠️", "ERROR": "❌"}
+        icon = LEVEL_ICONS.get(level, "📝")
 
-        icon = level_colors.get(level, "📝")
+        # Format and queue message
+        self._buffer.append(f"[{timestamp}] {icon} {level}: {message}\n")
+
+        if (
+            len(self._buffer) >= self.buffer_size
+            or severity >= self._level_hierarchy["WARNING"]
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            self.flush()
+
+    def is_enabled(self, level: str) -> bool:
+        """Check whether messages at a level would be output."""
+        return self._level_hierarchy.get(level.upper(), 1) >= self._min_level
+
+    def flush(self) -> None:
+        """Write any buffered log lines."""
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return
 
-        # Format and print message
-        formatted_message = f"[{timestamp}] {icon} {level}: {message}"
-        print(formatted_message)
+        lines = "".join(self._buffer)
+        self._buffer.clear()
+        sys.stdout.write(lines)
+        sys.stdout.flush()
 
-    def debug(self, message: str) -> None:
+    def debug(self, message: str, *args) -> None:
         """Log debug message."""
-        self.log("DEBUG", message)
+        self.log("DEBUG", message, *args)
 
-    def info(self, message: str) -> None:
+    def info(self, message: str, *args) -> None:
         """Log info message."""
-        self.log("INFO", message)
+        self.log("INFO", message, *args)
 
-    def warning(self, message: str) -> None:
+    def warning(self, message: str, *args) -> None:
         """Log warning message."""
-        self.log("WARNING", message)
+        self.log("WARNING", message, *args)
 
-    def error(self, message: str) -> None:
+    def error(self, message: str, *args) -> None:
         """Log error message."""
-        self.log("ERROR", message)
+        self.log("ERROR", message, *args)
 
     def time_operation(self, operation_name: str):
         """Context manager for timing operations."""
@@ -1,10 +1,18 @@
 """Intelligent word combination finder using semantic similarity."""
 
+import heapq
 import json
-from datetime import datetime
-from itertools import combinations
+import os
+import struct
+import time
+from itertools import chain, combinations
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+from application.interfaces import ILoggingService
+
+from .embedding_store import EmbeddingStore
 
 try:
     import numpy as np
@@ -24,6 +32,18 @@ except ImportError:
     COSINE_SIMILARITY_AVAILABLE = False
     cosine_similarity = None
 
+# Embeddings journal: header (magic, dimensions), then (u16 length, UTF-8 word, float16 vector) records
+EMBEDDINGS_JOURNAL_MAGIC = b"EMBJ"
+EMBEDDINGS_JOURNAL_HEADER = struct.Struct("<4sH")
+# Journal records that trigger rewriting the matrix instead of appending
+EMBEDDINGS_JOURNAL_COMPACT_ROWS = 1024
+
+# Words per forward pass when encoding uncached words in bulk
+ENCODE_BATCH_SIZE = 128
+
+# Severity of each level passed to SemanticService.log
+LOG_LEVELS = {"DEBUG": 0, "INFO": 1, "WARNING": 2, "ERROR": 3}
+
 
 # Fallback implementations for missing dependencies
 def fallback_cosine_similarity(vec1, vec2):
@@ -46,23 +66,44 @@ class SemanticService:
     Broken into smaller methods to avoid monolithic code.
     """
 
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2", cache_file: str = "../embeddings.cache.json"):
+    def __init__(
+        self,
+        model_name: str = "all-MiniLM-L6-v2",
+        cache_file: str = "../embeddings.cache.json",
+        include_self_pairs: bool = True,
+        candidate_pool_size: int = 0,
+        log_level: str = "INFO",
+        logging_service: Optional[ILoggingService] = None,
+    ):
         """
         Initialize the semantic finder with word embeddings model.
 
         Args:
             model_name: HuggingFace sentence transformer model name
             cache_file: Path to cache embeddings for performance
+            include_self_pairs: Whether to score A + A pairs (skip them if the caller can't test them)
+            candidate_pool_size: Only pair this many words, those most similar to the target (0 = all words)
+            log_level: Minimum level to print (DEBUG, INFO, WARNING, ERROR) when printing directly
+            logging_service: Optional logger to write through instead of printing, keeping output
+                in order with the caller's (possibly buffered) log
         """
+        self.logger = logging_service
+        self._min_level = LOG_LEVELS.get(log_level.upper(), 1)
         self.model = None
         self.model_name = model_name
         self.cache_file = cache_file
-        self.embeddings_cache = {}
+        self.include_self_pairs = include_self_pairs
+        self.candidate_pool_size = candidate_pool_size
+        self.embeddings_cache = EmbeddingStore()  # One contiguous float32 row per word
+        self.unsaved_embeddings = 0  # Embeddings encoded since the cache file was last written
+        self.journal_rows = 0  # Records appended to the embeddings journal since the matrix was written
 
         # Incremental processing optimization
         self.last_processed_elements = set()
         self.semantic_scores_cache = {}  # Cache for semantic similarity scores
+        self.ranked_scores = None  # semantic_scores_cache values by descending score, rebuilt after changes
         self.current_target_word = None
+        self.target_dots_memo = None  # (store, target embedding, dot with target per store row)
 
         # Load cached embeddings if available
         self._load_embeddings_cache()
@@ -72,7 +113,10 @@ class SemanticService:
             try:
                 self.log("INFO", f"🧠 Loading semantic model: {model_name}")
                 self.model = SentenceTransformer(model_name)
-                self.log("INFO", "✅ Semantic model loaded successfully")
+                # Half precision halves GPU compute and bandwidth; CPU fp16 kernels are slower, so keep fp32 there
+                if self.model.device.type == "cuda":
+                    self.model.half()
+                self.log("INFO", f"✅ Semantic model loaded successfully ({self.model.device})")
             except Exception as e:
                 self.log("ERROR", f"❌ Failed to load model: {e}")
                 self.model = None
@@ -80,9 +124,13 @@ class SemanticService:
             self.log("WARNING", "⚠️ Sentence transformers not available - falling back to basic heuristics")
 
     def log(self, level: str, message: str):
-        """Log a message with a timestamp."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        print(f"[{timestamp}] {level}: {message}")
+        """Log a message with a timestamp, if its level is enabled."""
+        if self.logger is not None:
+            self.logger.log(level, message)
+            return
+        if LOG_LEVELS.get(level, 1) < self._min_level:
+            return
+        print(f"[{time.strftime('%H:%M:%S')}] {level}: {message}")
 
     def _load_embeddings_cache(self):
         """Load cached embeddings from file for performance, respecting IGNORE_CACHE."""
@@ -94,60 +142,243 @@ class SemanticService:
 
             if ignore_cache:
                 self.log("INFO", "🔄 IGNORE_CACHE enabled - starting with empty embeddings cache")
-                self.embeddings_cache = {}
+                self.embeddings_cache = EmbeddingStore()
                 return
 
-            cache_path = Path(self.cache_file)
-            if cache_path.exists():
-                with open(cache_path, "r") as f:
-                    cache_data = json.load(f)
-                    self.embeddings_cache = {k: np.array(v) if np else v for k, v in cache_data.items()}
+            self.embeddings_cache, self.journal_rows = self._read_embeddings_file()
+            if self.embeddings_cache and not self._embeddings_cache_paths()[0].exists():
+                # Read from the legacy JSON cache; mark it unsaved so the first save writes the matrix
+                self.unsaved_embeddings = len(self.embeddings_cache)
+            if self.embeddings_cache:
                 self.log("INFO", f"📥 Loaded {len(self.embeddings_cache)} cached embeddings")
             else:
                 self.log("INFO", "📝 No embedding cache found - will create new one")
-                self.embeddings_cache = {}
         except Exception as e:
             self.log("WARNING", f"⚠️ Failed to load embedding cache: {e}")
-            self.embeddings_cache = {}
+            self.embeddings_cache = EmbeddingStore()
+
+    def _embeddings_cache_paths(self) -> Tuple[Path, Path, Path]:
+        """
+        Get the embeddings cache files derived from cache_file.
+
+        Returns:
+            Tuple of (float16 matrix .npy path, JSON word list path, append-only journal path);
+            row i of the matrix is word i
+        """
+        base = Path(self.cache_file)
+        return base.with_suffix(".npy"), base.with_suffix(".index.json"), base.with_suffix(".journal")
+
+    def _read_embeddings_file(self) -> Tuple[EmbeddingStore, int]:
+        """
+        Read cached embeddings from disk.
+
+        The .npy matrix is stored as float16, half the bytes of float32 at well under 0.001
+        cosine error for unit vectors, and is widened back to float32 in one call so scoring
+        runs on BLAS-friendly rows. Words appended to the journal since the matrix was last
+        written are applied on top. A legacy JSON cache at cache_file is read when no
+        matrix exists yet, and is replaced by the matrix on the next save.
+
+        Returns:
+            Tuple of (store of unit-length embeddings, number of journal records applied)
+        """
+        if np is None:
+            return EmbeddingStore(), 0
+
+        matrix_path, index_path, journal_path = self._embeddings_cache_paths()
+        legacy_path = Path(self.cache_file)
+        if matrix_path.exists() and index_path.exists():
+            with open(index_path, "r") as f:
+                words = json.load(f)
+            store = EmbeddingStore(np.load(matrix_path).astype(np.float32), words)
+        else:
+            store = EmbeddingStore()
+            if legacy_path.exists():
+                with open(legacy_path, "r") as f:
+                    cache_data = json.load(f)
+                store.update(list(cache_data), [self.normalize_embedding(v) for v in cache_data.values()])
+
+        journal_words = []
+        if journal_path.exists():
+            journal_words, journal_embeddings, _, _ = self._scan_embeddings_journal(journal_path.read_bytes())
+            store.update(journal_words, journal_embeddings)
+        return store, len(journal_words)
+
+    @staticmethod
+    def _scan_embeddings_journal(data: bytes) -> Tuple[List[str], "np.ndarray", Optional[int], int]:
+        """
+        Parse the (word, float16 embedding) records appended to the journal.
+
+        A record cut short by an interrupted write ends the valid part of the journal,
+        and a missing or foreign header leaves nothing valid at all.
+
+        Args:
+            data: Journal file contents
+
+        Returns:
+            Tuple of (words, float32 embeddings with one row per word, dimensions from the
+            header or None, byte offset where the valid records end)
+        """
+        if len(data) < EMBEDDINGS_JOURNAL_HEADER.size:
+            return [], np.empty((0, 0), dtype=np.float32), None, 0
+        magic, dimensions = EMBEDDINGS_JOURNAL_HEADER.unpack_from(data)
+        if magic != EMBEDDINGS_JOURNAL_MAGIC:
+            return [], np.empty((0, 0), dtype=np.float32), None, 0
+
+        vector_size = dimensions * 2  # float16
+        words, embeddings = [], []
+        offset = EMBEDDINGS_JOURNAL_HEADER.size
+        while offset + 2 <= len(data):
+            word_end = offset + 2 + int.from_bytes(data[offset : offset + 2], "little")
+            if word_end + vector_size > len(data):
+                break
+            try:
+                words.append(data[offset + 2 : word_end].decode("utf-8"))
+            except UnicodeDecodeError:
+                break
+            embeddings.append(np.frombuffer(data, dtype=np.float16, count=dimensions, offset=word_end))
+            offset = word_end + vector_size
+
+        return words, np.array(embeddings, dtype=np.float32).reshape(len(words), dimensions), dimensions, offset
 
     def _save_embeddings_cache(self):
-        """Save embeddings cache to file, merging with existing embeddings."""
-        try:
-            cache_path = Path(self.cache_file)
-            cache_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Load existing embeddings if file exists
-            existing_embeddings = {}
-            if cache_path.exists():
-                try:
-                    with open(cache_path, "r") as f:
-                        existing_data = json.load(f)
-                        existing_embeddings = {k: np.array(v) if np else v for k, v in existing_data.items()}
-                        self.log("DEBUG", f"📥 Loaded {len(existing_embeddings)} existing embeddings for merging")
-                except Exception as e:
-                    self.log("WARNING", f"⚠️ Could not load existing embeddings for merging: {e}")
-
-            # Merge session embeddings with existing (session takes precedence)
-            merged_embeddings = existing_embeddings.copy()
-            merged_embeddings.update(self.embeddings_cache)
-
-            # Convert numpy arrays to lists for JSON serialization
-            cache_data = {k: v.tolist() if hasattr(v, "tolist") else v for k, v in merged_embeddings.items()}
-
-            with open(cache_path, "w") as f:
-                json.dump(cache_data, f)
+        """
+        Persist embeddings encoded since the last save.
 
-            self.log(
-                "DEBUG",
-                f"💾 Merged and saved {len(cache_data)} embeddings to cache (session: {
-                    len(self.embeddings_cache)}, total: {len(cache_data)})",
-            )
+        New words are appended to the journal, so a save costs only what was added. Once
+        the journal holds EMBEDDINGS_JOURNAL_COMPACT_ROWS records (or there is no matrix
+        to append to yet) everything is merged back into the matrix and the journal removed.
+        """
+        if not self.unsaved_embeddings or np is None:
+            return
+
+        try:
+            matrix_path, index_path, journal_path = self._embeddings_cache_paths()
+            journal_has_room = self.journal_rows + self.unsaved_embeddings <= EMBEDDINGS_JOURNAL_COMPACT_ROWS
+            if matrix_path.exists() and journal_has_room and self._append_embeddings_journal(journal_path):
+                return
+            self._compact_embeddings_cache(matrix_path, index_path, journal_path)
         except Exception as e:
             self.log("WARNING", f"⚠️ Failed to save embedding cache: {e}")
 
-    def get_word_embedding(self, word: str) -> Optional[np.ndarray]:
+    def _append_embeddings_journal(self, journal_path: Path) -> bool:
         """
-        Get word embedding, using cache when possible.
+        Append the unsaved embeddings to the journal as (u16 length, UTF-8 word, float16 vector) records.
+
+        Returns:
+            True if appended, False if the journal can't take them and the cache should be compacted
+        """
+        # Words are only ever added, never re-encoded, so the unsaved ones are the store's last rows
+        store = self.embeddings_cache
+        words = store.words[-self.unsaved_embeddings :]
+        embeddings = store.matrix[-self.unsaved_embeddings :].astype(np.float16)
+
+        records = bytearray()
+        journaled = 0
+        for word, embedding in zip(words, embeddings):
+            encoded = word.encode("utf-8")
+            if len(encoded) >= 0xFFFF:
+                # Doesn't fit the u16 length; it stays in memory and is written on the next compaction
+                self.log("WARNING", f"⚠️ Not journaling embedding for {len(encoded)}-byte word '{word[:40]}...'")
+                continue
+            records += len(encoded).to_bytes(2, "little") + encoded + embedding.tobytes()
+            journaled += 1
+
+        journal_path.touch(exist_ok=True)
+        with open(journal_path, "r+b") as f:
+            _, _, journal_dimensions, valid_end = self._scan_embeddings_journal(f.read())
+            if journal_dimensions not in (None, embeddings.shape[1]):
+                self.log(
+                    "WARNING",
+                    f"⚠️ Embeddings journal holds {journal_dimensions}-d vectors, not {
+                        embeddings.shape[1]}-d - rewriting the cache instead",
+                )
+                return False
+
+            # Drop a torn tail (or an invalid header) so new records start on a record boundary
+            f.seek(valid_end)
+            f.truncate()
+            if valid_end == 0:
+                f.write(EMBEDDINGS_JOURNAL_HEADER.pack(EMBEDDINGS_JOURNAL_MAGIC, embeddings.shape[1]))
+
+            # One write per save, synced so a crash can at most cut the last record short
+            f.write(records)
+            f.flush()
+            os.fsync(f.fileno())
+
+        self.journal_rows += journaled
+        self.unsaved_embeddings = 0
+        self.log("DEBUG", f"💾 Appended {journaled} embeddings to cache journal ({self.journal_rows} journaled)")
+        return True
+
+    def _compact_embeddings_cache(self, matrix_path: Path, index_path: Path, journal_path: Path) -> None:
+        """Rewrite the matrix with every cached embedding, merging with the files on disk, and drop the journal."""
+        matrix_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Load existing embeddings (another session may have added some)
+        existing_embeddings = EmbeddingStore()
+        try:
+            existing_embeddings, _ = self._read_embeddings_file()
+            self.log("DEBUG", f"📥 Loaded {len(existing_embeddings)} existing embeddings for merging")
+        except Exception as e:
+            self.log("WARNING", f"⚠️ Could not load existing embeddings for merging: {e}")
+
+        # Embeddings from another model can't share the matrix; the session's model wins
+        dimensions = self.embeddings_cache.matrix.shape[1]
+        if len(existing_embeddings) and existing_embeddings.matrix.shape[1] != dimensions:
+            self.log("WARNING", f"⚠️ Discarding cached embeddings that are not {dimensions}-d")
+            existing_embeddings = EmbeddingStore()
+
+        # Merge session embeddings with existing (session takes precedence)
+        session_count = len(self.embeddings_cache)
+        existing_embeddings.update(self.embeddings_cache.words, self.embeddings_cache.matrix)
+        words = existing_embeddings.words
+        matrix = existing_embeddings.matrix
+
+        # Keep the merged store, so later saves only have to add this session's new words
+        self.embeddings_cache = existing_embeddings
+
+        # Write each file next to its target and swap it in, so a crash never leaves a partial cache
+        matrix_tmp = matrix_path.with_name(matrix_path.name + ".tmp")
+        with open(matrix_tmp, "wb") as f:
+            np.save(f, matrix.astype(np.float16))
+        index_tmp = index_path.with_name(index_path.name + ".tmp")
+        with open(index_tmp, "w") as f:
+            json.dump(words, f)
+        os.replace(matrix_tmp, matrix_path)
+        os.replace(index_tmp, index_path)
+        journal_path.unlink(missing_ok=True)  # Its records are now in the matrix
+        self.journal_rows = 0
+        self.unsaved_embeddings = 0
+
+        self.log(
+            "DEBUG",
+            f"💾 Merged and saved {len(words)} embeddings to cache (session: {session_count}, total: {len(words)})",
+        )
+
+    @staticmethod
+    def normalize_embedding(vector):
+        """
+        Scale an embedding to unit length.
+
+        Every cached embedding is stored normalized, so cosine similarity between
+        them is a plain dot product.
+
+        Args:
+            vector: Embedding vector (array or list)
+
+        Returns:
+            Unit-length float32 vector, or the vector unchanged without NumPy
+        """
+        if np is None:
+            return vector
+        vector = np.asarray(vector, dtype=np.float32)
+        vector = vector / (np.linalg.norm(vector) + 1e-12)
+        vector.flags.writeable = False  # Shared from the cache, never copied
+        return vector
+
+    def get_word_embedding(self, word: str) -> Optional["np.ndarray"]:
+        """
+        Get unit-length word embedding, using cache when possible.
 
         Args:
             word: Word to get embedding for
@@ -159,19 +390,49 @@ class SemanticService:
             return None
 
         # Check cache first
-        if word in self.embeddings_cache:
-            cached = self.embeddings_cache[word]
-            return np.array(cached) if np else cached
+        cached = self.embeddings_cache.get(word)
+        if cached is not None:
+            return cached
 
         try:
             # Generate new embedding
-            embedding = self.model.encode([word])[0]
+            embedding = self.normalize_embedding(self.model.encode([word])[0])
             self.embeddings_cache[word] = embedding
+            self.unsaved_embeddings += 1
             return embedding
         except Exception as e:
             self.log("WARNING", f"⚠️ Failed to get embedding for '{word}': {e}")
             return None
 
+    def encode_missing_embeddings(self, words: List[str]) -> None:
+        """
+        Encode every word not yet in the embeddings cache in one batched model call.
+
+        The model amortizes tokenization and the forward pass across a batch, so this
+        avoids paying that overhead once per uncached word in get_word_embedding.
+
+        Args:
+            words: Words that are about to be looked up
+        """
+        if not self.model:
+            return
+
+        missing = [word for word in dict.fromkeys(words) if word not in self.embeddings_cache]
+        if not missing:
+            return
+
+        try:
+            embeddings = self.model.encode(
+                missing, batch_size=ENCODE_BATCH_SIZE, show_progress_bar=False, convert_to_numpy=True
+            )
+        except Exception as e:
+            # get_word_embedding retries each word on its own
+            self.log("WARNING", f"⚠️ Failed to batch encode {len(missing)} words: {e}")
+            return
+
+        self.embeddings_cache.update(missing, [self.normalize_embedding(embedding) for embedding in embeddings])
+        self.unsaved_embeddings += len(missing)
+
     def cosine_similarity(self, vec1, vec2) -> float:
         """
         Calculate cosine similarity between two vectors.
@@ -242,6 +503,7 @@ class SemanticService:
             )
             # Only clear semantic cache if target actually changed, not on every call
             self.semantic_scores_cache.clear()
+            self.ranked_scores = None
             self.current_target_word = target_word
 
         new_elements = current_elements - self.last_processed_elements
@@ -274,6 +536,8 @@ class SemanticService:
         self.log("INFO", f"🎯 Finding best combinations for target: '{target_word}'")
         self.log("INFO", f"📋 Available words: {len(available_words)}")
 
+        self.encode_missing_embeddings([target_word, *available_words])
+
         # Get target embedding
         target_embedding = self.get_word_embedding(target_word)
         if target_embedding is None:
@@ -294,28 +558,72 @@ class SemanticService:
         self.log("INFO", f"🧠 Computing similarities for {len(word_embeddings)} words...")
         return target_embedding, word_embeddings
 
+    def _target_dots(self, target_embedding) -> "np.ndarray":
+        """
+        Get every stored word's dot product with the target, indexed by embeddings_cache row.
+
+        The target stays fixed across a hunt while words are only ever appended, so the
+        vector is kept between calls and extended with just the rows added since.
+
+        Args:
+            target_embedding: Unit-length target embedding
+
+        Returns:
+            Float32 array with one dot product per stored word
+        """
+        store = self.embeddings_cache
+        memo = self.target_dots_memo
+        if memo is None or memo[0] is not store or not np.array_equal(memo[1], target_embedding):
+            memo = (store, np.array(target_embedding, dtype=np.float32), np.empty(0, dtype=np.float32))
+
+        dots = memo[2]
+        if len(dots) < len(store):
+            dots = np.concatenate((dots, store.matrix[len(dots) :] @ memo[1]))
+            memo = (store, memo[1], dots)
+        self.target_dots_memo = memo
+        return dots
+
+    def _select_candidate_pool(self, word_embeddings: Dict, target_embedding) -> Dict:
+        """
+        Keep the candidate_pool_size words most similar to the target.
+
+        A merged pair can only land near the target if its words do, so pairing just the
+        closest words cuts the pairs to score from N² to pool² at the cost of exactness.
+        """
+        if not self.candidate_pool_size or len(word_embeddings) <= self.candidate_pool_size:
+            return word_embeddings
+
+        # Embeddings are unit length, so the dot product is the cosine similarity
+        words = list(word_embeddings)
+        similarities = self._target_dots(target_embedding)[self.embeddings_cache.rows_for(words)]
+        # Partial partition picks the pool in O(N); only the pool itself is sorted
+        closest = np.argpartition(-similarities, self.candidate_pool_size - 1)[: self.candidate_pool_size]
+        pool = [words[i] for i in closest[np.argsort(-similarities[closest], kind="stable")]]
+
+        self.log("INFO", f"🎯 Candidate pool: {len(pool)} of {len(word_embeddings)} words closest to target")
+        return {word: word_embeddings[word] for word in pool}
+
     def _generate_and_filter_combinations(self, word_embeddings: Dict, cache_service) -> List[tuple]:
         """Generate all possible combinations and filter cached ones if needed."""
 
-        # Generate all possible combinations including same word twice
-        all_possible_combinations = []
+        # Stream all possible combinations (A+B where A != B, then A+A) straight into the filter,
+        # so only the pairs that will be scored are ever collected
         word_list = list(word_embeddings.keys())
-
-        # Add combinations without repetition (A+B where A != B)
-        for word1, word2 in combinations(word_list, 2):
-            all_possible_combinations.append((word1, word2))
-
-        # Add combinations with repetition (A+A)
-        for word in word_list:
-            all_possible_combinations.append((word, word))
+        word_count = len(word_list)
+        all_possible_combinations = combinations(word_list, 2)
+        total_combinations = word_count * (word_count - 1) // 2
+        if self.include_self_pairs:
+            all_possible_combinations = chain(all_possible_combinations, zip(word_list, word_list))
+            total_combinations += word_count
 
         # Filter out cached combinations BEFORE expensive semantic computation
         if cache_service:
+            is_tested = cache_service.get_tested_names_checker()
             filtered_combinations = []
             cached_count = 0
             for word1, word2 in all_possible_combinations:
                 # Only keep uncached combinations
-                if not cache_service.is_combination_tested_by_names(word1, word2):
+                if not is_tested(word1, word2):
                     filtered_combinations.append((word1, word2))
                 else:
                     cached_count += 1
@@ -325,14 +633,12 @@ class SemanticService:
             combinations_to_test = filtered_combinations
             self.log(
                 "INFO",
-                f"🔍 Filtered {len(all_possible_combinations)
-                              } -> {len(combinations_to_test)} uncached combinations ({cached_count} cached)",
+                f"🔍 Filtered {total_combinations} -> {len(combinations_to_test)} uncached combinations ({
+                    cached_count} cached)",
             )
         else:
-            combinations_to_test = all_possible_combinations
-            self.log(
-                "INFO", f"🔍 No cache service provided - testing all {len(all_possible_combinations)} combinations"
-            )
+            combinations_to_test = list(all_possible_combinations)
+            self.log("INFO", f"🔍 No cache service provided - testing all {total_combinations} combinations")
 
         if not combinations_to_test:
             self.log("INFO", "⚠️ No uncached combinations found")
@@ -342,16 +648,68 @@ class SemanticService:
     def _score_combinations(
         self, combinations_to_test: List[tuple], word_embeddings: Dict, target_embedding, test_alphas: bool
     ) -> List[Dict]:
-        """Score all combinations using semantic similarity."""
+        """
+        Score all combinations using semantic similarity.
+
+        With NumPy available, every pair is scored at once: for unit embeddings u, v, t and
+        merged = a·u + (1-a)·v, merged·t and |merged|² expand into the words' dot products
+        with the target and with each other, so no merged vectors are ever built.
+        """
+        if np is None or not combinations_to_test:
+            return self._score_combinations_pairwise(
+                combinations_to_test, word_embeddings, target_embedding, test_alphas
+            )
+
+        words = list(word_embeddings)
+        word_index = {word: i for i, word in enumerate(words)}
+        rows = self.embeddings_cache.rows_for(words)
+        embeddings = self.embeddings_cache.matrix[rows]  # One gather, no stacking
+
+        count = len(combinations_to_test)
+        first = np.fromiter((word_index[word1] for word1, _ in combinations_to_test), dtype=np.intp, count=count)
+        second = np.fromiter((word_index[word2] for _, word2 in combinations_to_test), dtype=np.intp, count=count)
+
+        target_dots = self._target_dots(target_embedding)[rows]  # u·t for every word
+        gram = embeddings @ embeddings.T  # u·v for every word pair
+        pair_target = (target_dots[first], target_dots[second])
+        pair_dots = gram[first, second]
+
+        alphas = [0.0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0] if test_alphas else [0.5]
+        # Every alpha at once as an (alphas x pairs) grid, broadcasting the weights down the rows
+        weights = np.asarray(alphas, dtype=np.float32)[:, None]
+        complements = 1 - weights
+        dots = weights * pair_target[0] + complements * pair_target[1]
+        # |u| = |v| = |t| = 1
+        norms_sq = weights * weights + complements * complements + 2 * weights * complements * pair_dots
+        denominators = np.sqrt(np.maximum(norms_sq, 0))
+        scores = np.zeros_like(dots)
+        np.divide(dots, denominators, out=scores, where=denominators != 0)
+
+        # First alpha wins ties, as in the pairwise loop
+        best_rows = scores.argmax(axis=0)
+        best_scores = scores[best_rows, np.arange(count)].tolist()
+
         combinations_scores = []
-        total_combinations = len(combinations_to_test)
-        processed = 0
+        for (word1, word2), best_score, best_row in zip(combinations_to_test, best_scores, best_rows.tolist()):
+            combinations_scores.append(
+                {
+                    "word1": word1,
+                    "word2": word2,
+                    "score": best_score,
+                    "alpha": alphas[best_row],
+                    "confidence": "high" if best_score > 0.7 else "medium" if best_score > 0.5 else "low",
+                }
+            )
 
-        for word1, word2 in combinations_to_test:
-            processed += 1
-            if processed % 1000 == 0:
-                self.log("DEBUG", f"📊 Processed {processed}/{total_combinations} combinations...")
+        return combinations_scores
 
+    def _score_combinations_pairwise(
+        self, combinations_to_test: List[tuple], word_embeddings: Dict, target_embedding, test_alphas: bool
+    ) -> List[Dict]:
+        """Score combinations one merged vector at a time (used when NumPy is unavailable)."""
+        combinations_scores = []
+
+        for word1, word2 in combinations_to_test:
             best_score = -1
             best_alpha = 0.5
 
@@ -382,10 +740,17 @@ class SemanticService:
         return combinations_scores
 
     def _format_top_results(self, combinations_scores: List[Dict], top_k: int) -> List[Dict]:
-        """Sort and format top combinations."""
-        # Sort by score and return top k
-        combinations_scores.sort(key=lambda x: x["score"], reverse=True)
-        top_combinations = combinations_scores[:top_k]
+        """Select and format top combinations."""
+        if np is not None and 0 < top_k < len(combinations_scores):
+            # Partition out the top k in O(N), then order just those
+            scores = np.fromiter(
+                (combo["score"] for combo in combinations_scores), dtype=np.float32, count=len(combinations_scores)
+            )
+            top_indices = np.argpartition(-scores, top_k - 1)[:top_k]
+            top_indices = top_indices[np.argsort(-scores[top_indices], kind="stable")]
+            top_combinations = [combinations_scores[i] for i in top_indices]
+        else:
+            top_combinations = sorted(combinations_scores, key=lambda x: x["score"], reverse=True)[:top_k]
 
         self.log("INFO", f"🏆 Top {len(top_combinations)} semantic combinations:")
         for i, combo in enumerate(top_combinations, 1):
@@ -424,47 +789,49 @@ class SemanticService:
             "wizard": ["magic", "spell", "wand", "mystical", "power"],
         }
 
-        combinations_scores = []
         target_lower = target_word.lower()
 
         # Find related words
         related_words = concept_map.get(target_lower, [])
 
-        # Score combinations based on simple heuristics
-        for word1 in available_words:
-            for word2 in available_words:
-                if word1 >= word2:  # Avoid duplicates (A+B vs B+A)
-                    continue
-
-                score = 0.0
-
-                # Boost if either word is conceptually related
-                if word1.lower() in related_words or word2.lower() in related_words:
-                    score += 0.5
-
-                # Boost if words share letters with target
-                shared_letters1 = len(set(word1.lower()) & set(target_lower))
-                shared_letters2 = len(set(word2.lower()) & set(target_lower))
-                score += (shared_letters1 + shared_letters2) * 0.1
-
-                # Boost for shorter words (easier to combine)
-                if len(word1) < 6 and len(word2) < 6:
-                    score += 0.2
-
-                if score > 0.1:  # Only include combinations with some potential
-                    combinations_scores.append(
-                        {
-                            "word1": word1,
-                            "word2": word2,
-                            "score": min(score, 0.9),  # Cap at 0.9 to show these are heuristic
-                            "alpha": 0.5,
-                            "confidence": "low",
-                        }
-                    )
-
-        # Sort and return top results
-        combinations_scores.sort(key=lambda x: x["score"], reverse=True)
-        return combinations_scores[:top_k]
+        # Per-word features are computed once, so the pair loop below only adds numbers:
+        # (word, conceptually related, letters shared with target, short word)
+        target_letters = set(target_lower)
+        word_features = [
+            (word, word.lower() in related_words, len(set(word.lower()) & target_letters), len(word) < 6)
+            for word in available_words
+        ]
+
+        def scored_pairs():
+            for word1, related1, shared_letters1, short1 in word_features:
+                for word2, related2, shared_letters2, short2 in word_features:
+                    if word1 >= word2:  # Avoid duplicates (A+B vs B+A)
+                        continue
+
+                    # Boost if either word is conceptually related
+                    score = 0.5 if related1 or related2 else 0.0
+
+                    # Boost if words share letters with target
+                    score += (shared_letters1 + shared_letters2) * 0.1
+
+                    # Boost for shorter words (easier to combine)
+                    if short1 and short2:
+                        score += 0.2
+
+                    if score > 0.1:  # Only include combinations with some potential
+                        yield min(score, 0.9), word1, word2  # Cap at 0.9 to show these are heuristic
+
+        # Keep only the top results instead of sorting every pair (ties keep generation order)
+        return [
+            {
+                "word1": word1,
+                "word2": word2,
+                "score": score,
+                "alpha": 0.5,
+                "confidence": "low",
+            }
+            for score, word1, word2 in heapq.nlargest(top_k, scored_pairs(), key=itemgetter(0))
+        ]
 
     def _full_processing(
         self, available_words: List[str], target_word: str, top_k: int, test_alphas: bool, cache_service
@@ -474,6 +841,7 @@ class SemanticService:
         target_embedding, word_embeddings = self._prepare_embeddings(available_words, target_word)
         if target_embedding is None or len(word_embeddings) < 2:
             return []
+        word_embeddings = self._select_candidate_pool(word_embeddings, target_embedding)
 
         # Step 2: Generate and filter combinations
         combinations_to_test = self._generate_and_filter_combinations(word_embeddings, cache_service)
@@ -489,6 +857,7 @@ class SemanticService:
         for combo in combinations_scores:
             cache_key = f"{combo['word1']}+{combo['word2']}"
             self.semantic_scores_cache[cache_key] = combo
+        self.ranked_scores = None
 
         # Update tracking
         self.last_processed_elements = set(available_words)
@@ -506,7 +875,8 @@ class SemanticService:
         cache_service,
     ) -> List[Dict]:
         """Incremental processing - only compute combinations involving new elements."""
-        # Step 1: Prepare embeddings (only for new elements + target)
+        # Step 1: Prepare embeddings (only new elements and the target can be uncached)
+        self.encode_missing_embeddings([target_word, *new_elements])
         target_embedding = self.get_word_embedding(target_word)
         if target_embedding is None:
             return []
@@ -525,6 +895,12 @@ class SemanticService:
             if embedding is not None:
                 all_word_embeddings[word] = embedding
 
+        # Keep new words only if they made it into the candidate pool
+        all_word_embeddings = self._select_candidate_pool(all_word_embeddings, target_embedding)
+        new_word_embeddings = {
+            word: embedding for word, embedding in new_word_embeddings.items() if word in all_word_embeddings
+        }
+
         if not new_word_embeddings or len(all_word_embeddings) < 2:
             # No new embeddings, return cached results
             return self._get_top_from_cache(top_k, cache_service)
@@ -540,7 +916,7 @@ class SemanticService:
                     word1, word2 = sorted([new_word, other_word])
                     new_combinations.append((word1, word2))
                 # Also add self-combinations for new elements
-                elif new_word == other_word:
+                elif self.include_self_pairs:
                     new_combinations.append((new_word, new_word))
 
         # Remove duplicates and filter cached combinations
@@ -562,6 +938,7 @@ class SemanticService:
             for combo in new_combinations_scores:
                 cache_key = f"{combo['word1']}+{combo['word2']}"
                 self.semantic_scores_cache[cache_key] = combo
+            self.ranked_scores = None
 
         # Update tracking
         self.last_processed_elements = set(available_words)
@@ -574,15 +951,21 @@ class SemanticService:
         if not self.semantic_scores_cache:
             return []
 
+        # Rank once per change to the scores; repeat calls with the same elements just walk the ranking
+        if self.ranked_scores is None:
+            self.ranked_scores = sorted(self.semantic_scores_cache.values(), key=lambda x: x["score"], reverse=True)
+
         # ALWAYS filter against current combination cache state (this is key to avoiding repeats)
-        filtered_combinations = []
         if cache_service:
             # ALWAYS check CURRENT cache state for each combination (IGNORE_CACHE only affects initial loading)
+            is_tested = cache_service.get_tested_names_checker()
+            top_combinations = []
             cache_filter_count = 0
-            for combo in self.semantic_scores_cache.values():
-                is_tested = cache_service.is_combination_tested_by_names(combo["word1"], combo["word2"])
-                if not is_tested:
-                    filtered_combinations.append(combo)
+            for combo in self.ranked_scores:
+                if not is_tested(combo["word1"], combo["word2"]):
+                    top_combinations.append(combo)
+                    if len(top_combinations) == top_k:
+                        break
                 else:
                     cache_filter_count += 1
                     if cache_filter_count <= 3:  # Log first 3 filtered combinations
@@ -590,19 +973,15 @@ class SemanticService:
 
             self.log(
                 "INFO",
-                f"🔍 Filtered semantic cache: {len(self.semantic_scores_cache)} total → {
-                    len(filtered_combinations)} untested ({cache_filter_count} already cached)",
+                f"🔍 Filtered semantic cache: {len(self.semantic_scores_cache)} total → top {
+                    len(top_combinations)} untested ({cache_filter_count} already cached skipped)",
             )
         else:
-            filtered_combinations = list(self.semantic_scores_cache.values())
+            top_combinations = self.ranked_scores[:top_k]
             self.log(
                 "WARNING", f"⚠️ No cache_service provided - using all {len(self.semantic_scores_cache)} combinations"
             )
 
-        # Sort and return top results
-        filtered_combinations.sort(key=lambda x: x["score"], reverse=True)
-        top_combinations = filtered_combinations[:top_k]
-
         if top_combinations:
             self.log("INFO", f"🏆 Top {len(top_combinations)} untested combinations:")
             for i, combo in enumerate(top_combinations, 1):
@@ -620,9 +999,5 @@ class SemanticService:
             return combinations
 
         # ALWAYS filter during runtime (IGNORE_CACHE only affects initial cache loading)
-        filtered = []
-        for word1, word2 in combinations:
-            if not cache_service.is_combination_tested_by_names(word1, word2):
-                filtered.append((word1, word2))
-
-        return filtered
+        is_tested = cache_service.get_tested_names_checker()
+        return [(word1, word2) for word1, word2 in combinations if not is_tested(word1, word2)]
@@ -1,11 +1,88 @@
 """Service for workspace management and element positioning."""
 
-from typing import Dict, List
+from itertools import chain
+from typing import Dict, List, Tuple
 
 from application.interfaces import IBrowserService, ILoggingService
 from domain.models import Element, ElementPosition, PositionedElement, Workspace
 from domain.services import GameMechanics
 
+# Workspace container lookup, resolved once per page and kept on window for later calls
+WORKSPACE_ROOT_JS = """
+var workspace = window.__wsRoot;
+if (!workspace || !document.contains(workspace)) {
+    workspace = document.getElementById('instances') ||
+        document.getElementsByClassName('instances')[0] ||
+        document.getElementById('app') ||
+        document.getElementsByTagName('main')[0];
+    window.__wsRoot = workspace;
+}
+"""
+
+# Workspace snapshot script, assembled once so polls reuse the same string
+WORKSPACE_SNAPSHOT_JS = (
+    WORKSPACE_ROOT_JS
+    + """
+if (!workspace) return [];
+
+// Look for instance elements in workspace
+var items = workspace.querySelectorAll('.instance, .item[data-item-id]');
+var elements = [];
+
+// Visible workspace area, measured once per poll rather than hardcoded viewport pixels
+var bounds = workspace.getBoundingClientRect();
+
+items.forEach(function(item, index) {
+    // The #app/main fallback roots also contain the sidebar, whose items are not on the canvas
+    if (item.closest('#sidebar, .sidebar')) return;
+
+    var rect = item.getBoundingClientRect();
+    var text = item.textContent || item.innerText || '';
+    var emoji = item.getAttribute('data-emoji') || '';
+    var id = item.getAttribute('data-item-id') || 'workspace_' + index;
+
+    // Only include elements inside the workspace container
+    if (rect.left >= bounds.left && rect.left <= bounds.right &&
+        rect.top >= bounds.top && rect.top <= bounds.bottom && text.trim()) {
+        elements.push({
+            name: text.trim(),
+            emoji: emoji,
+            id: id,
+            x: Math.round(rect.left + rect.width / 2),
+            y: Math.round(rect.top + rect.height / 2),
+            width: rect.width,
+            height: rect.height
+        });
+    }
+});
+
+return elements;
+"""
+)
+
+# Returns the id of the first workspace item whose text contains arguments[0], or null
+WORKSPACE_FIND_ITEM_JS = (
+    WORKSPACE_ROOT_JS
+    + """
+var name = arguments[0].toLowerCase();
+if (!workspace) return null;
+
+var items = workspace.getElementsByClassName('instance');
+for (var i = 0; i < items.length; i++) {
+    if ((items[i].textContent || '').toLowerCase().indexOf(name) >= 0) {
+        return items[i].getAttribute('data-item-id') || String(i);
+    }
+}
+return null;
+"""
+)
+
+# Workspace container for mutation observers (the browser falls back to the whole body)
+WORKSPACE_SELECTOR = "#instances, .instances"
+
+# Clear-dialog confirmation button; scoped to <button> so the XPath doesn't walk every node in the document
+YES_BUTTON_XPATH = '//button[normalize-space()="Yes"]'
+
 
 class WorkspaceService:
     """
@@ -46,64 +123,37 @@ class WorkspaceService:
         """
         try:
             # Use JavaScript to query workspace elements (matches original approach)
-            workspace_data = self.browser.execute_script(
-                """
-                // Look for workspace container
-                var workspace = document.querySelector('#instances, .instances, [class*="instances"]');
-                if (!workspace) {
-                    // Fallback: look for any container with elements
-                    workspace = document.querySelector('#app, .app, main');
-                }
-
-                if (!workspace) return [];
-
-                // Look for instance elements in workspace
-                var items = workspace.querySelectorAll('.instance, .item[data-item-id]');
-                var elements = [];
-
-                items.forEach(function(item, index) {
-                    var rect = item.getBoundingClientRect();
-                    var text = item.textContent || item.innerText || '';
-                    var emoji = item.getAttribute('data-emoji') || '';
-                    var id = item.getAttribute('data-item-id') || 'workspace_' + index;
-
-                    // Only include elements in reasonable workspace area
-                    if (rect.left >= 200 && rect.left <= 1000 &&
-                        rect.top >= 200 && rect.top <= 400 && text.trim()) {
-                        elements.push({
-                            name: text.trim(),
-                            emoji: emoji,
-                            id: id,
-                            x: Math.round(rect.left + rect.width / 2),
-                            y: Math.round(rect.top + rect.height / 2),
-                            width: rect.width,
-                            height: rect.height
-                        });
-                    }
-                });
-
-                return elements;
-            """
-            )
-
-            # Convert to domain models
-            positioned_elements = []
+            workspace_data = self.browser.execute_script(WORKSPACE_SNAPSHOT_JS)
+
+            # Diff against tracked elements by (id, x, y) so elements that persisted keep their domain
+            # objects. The id names the element type, so several tiles can share one key: keep a list per key.
+            snapshot: Dict[Tuple[str, int, int], List[dict]] = {}
             for elem_data in workspace_data:
+                snapshot.setdefault((elem_data["id"], elem_data["x"], elem_data["y"]), []).append(elem_data)
+
+            for positioned in list(self.workspace.elements):
+                key = (positioned.element.element_id, positioned.position.x, positioned.position.y)
+                matches = snapshot.get(key)
+                if matches:
+                    matches.pop()
+                else:
+                    self.workspace.remove_positioned_element(positioned)
+                    self.logger.debug("📍 Removed %s from workspace", positioned.element.display_name)
+
+            # Whatever is left in the snapshot is new (or moved) since the last poll
+            for elem_data in chain.from_iterable(snapshot.values()):
                 try:
                     element = Element(name=elem_data["name"], emoji=elem_data["emoji"], element_id=elem_data["id"])
-
-                    position = ElementPosition(elem_data["x"], elem_data["y"])
-                    positioned_element = element.with_position(position)
-                    positioned_elements.append(positioned_element)
+                    self.add_element_to_workspace(element, ElementPosition(elem_data["x"], elem_data["y"]))
 
                 except Exception as e:
                     self.logger.debug(f"❌ Failed to create element from data {elem_data}: {e}")
                     continue
 
-            # Update internal workspace
-            self.workspace.elements = positioned_elements
+            # Return a copy so callers can keep comparing snapshots across polls
+            positioned_elements = list(self.workspace.elements)
 
-            self.logger.debug(f"📊 Found {len(positioned_elements)} elements in workspace")
+            self.logger.debug("📊 Found %s elements in workspace", len(positioned_elements))
             return positioned_elements
 
         except Exception as e:
@@ -120,7 +170,7 @@ class WorkspaceService:
         location = self.workspace.get_next_location()
 
         self.logger.debug(
-            f"📍 Next workspace location: {location.name} at ({location.position.x}, {location.position.y})"
+            "📍 Next workspace location: %s at (%s, %s)", location.name, location.position.x, location.position.y
         )
         return location.position
 
@@ -138,16 +188,20 @@ class WorkspaceService:
 
         tolerance = config.ELEMENT_POSITION_TOLERANCE
 
-        for positioned_element in self.workspace.elements:
+        # Only elements within tolerance on the x-axis can be close enough to occupy this position
+        for positioned_element in self.workspace.elements_in_x_range(position.x, tolerance):
             # Check if any existing element is too close to this position
             distance = abs(positioned_element.position.x - position.x) + abs(positioned_element.position.y - position.y)
             if distance < tolerance:
                 self.logger.debug(
-                    f"🚫 Location ({position.x}, {position.y}) occupied by {positioned_element.element.display_name}"
+                    "🚫 Location (%s, %s) occupied by %s",
+                    position.x,
+                    position.y,
+                    positioned_element.element.display_name,
                 )
                 return False
 
-        self.logger.debug(f"✅ Location ({position.x}, {position.y}) is empty")
+        self.logger.debug("✅ Location (%s, %s) is empty", position.x, position.y)
         return True
 
     def should_clear_workspace(self) -> bool:
@@ -207,18 +261,13 @@ class WorkspaceService:
                 time.sleep(config.DIALOG_CLOSE_DELAY)
 
                 # Find and click Yes button
-                yes_buttons = self.browser.driver.find_elements(By.XPATH, '//*[contains(text(), "Yes")]')
-                for btn in yes_buttons:
-                    if btn.is_displayed():
-                        btn.click()
-                        self.logger.debug("✅ Browser workspace cleared successfully")
-
-                        # Also clear our tracking after successful browser clear
-                        tracking_cleared = self.clear_workspace_tracking()
-                        self.logger.info(
-                            f"🧹 REAL CLEAR: Browser workspace + {tracking_cleared} tracked elements cleared"
-                        )
-                        return True
+                if self._confirm_clear_dialog():
+                    self.logger.debug("✅ Browser workspace cleared successfully")
+
+                    # Also clear our tracking after successful browser clear
+                    tracking_cleared = self.clear_workspace_tracking()
+                    self.logger.info(f"🧹 REAL CLEAR: Browser workspace + {tracking_cleared} tracked elements cleared")
+                    return True
 
                 self.logger.warning("⚠️ Clear button clicked but no Yes confirmation found")
                 # Still clear tracking even if confirmation not found
@@ -238,18 +287,13 @@ class WorkspaceService:
 
                 time.sleep(config.DIALOG_CLOSE_DELAY)
 
-                yes_buttons = self.browser.driver.find_elements(By.XPATH, '//*[contains(text(), "Yes")]')
-                for btn in yes_buttons:
-                    if btn.is_displayed():
-                        btn.click()
-                        self.logger.debug("✅ Browser workspace cleared via trash icon")
+                if self._confirm_clear_dialog():
+                    self.logger.debug("✅ Browser workspace cleared via trash icon")
 
-                        # Also clear our tracking after successful browser clear
-                        tracking_cleared = self.clear_workspace_tracking()
-                        self.logger.info(
-                            f"🧹 REAL CLEAR: Browser workspace + {tracking_cleared} tracked elements cleared"
-                        )
-                        return True
+                    # Also clear our tracking after successful browser clear
+                    tracking_cleared = self.clear_workspace_tracking()
+                    self.logger.info(f"🧹 REAL CLEAR: Browser workspace + {tracking_cleared} tracked elements cleared")
+                    return True
 
                 self.logger.warning("⚠️ Trash icon clicked but no Yes confirmation found")
                 # Still clear tracking even if confirmation not found
@@ -268,6 +312,21 @@ class WorkspaceService:
             self.logger.error(f"❌ Workspace clear failed completely: {e}")
             return False
 
+    def _confirm_clear_dialog(self) -> bool:
+        """
+        Click the visible "Yes" button of the clear confirmation dialog.
+
+        Returns:
+            True if a confirmation button was clicked
+        """
+        from selenium.webdriver.common.by import By
+
+        for btn in self.browser.driver.find_elements(By.XPATH, YES_BUTTON_XPATH):
+            if btn.is_displayed():
+                btn.click()
+                return True
+        return False
+
     def add_element_to_workspace(self, element: Element, position: ElementPosition) -> PositionedElement:
         """
         Add an element to workspace tracking at specific position.
@@ -281,7 +340,7 @@ class WorkspaceService:
         """
         positioned_element = self.workspace.add_element(element, position)
 
-        self.logger.debug(f"📍 Added {element.display_name} to workspace at ({position.x}, {position.y})")
+        self.logger.debug("📍 Added %s to workspace at (%s, %s)", element.display_name, position.x, position.y)
         return positioned_element
 
     def remove_element_from_workspace(self, element: Element) -> bool:
@@ -297,9 +356,9 @@ class WorkspaceService:
         removed = self.workspace.remove_element(element)
 
         if removed:
-            self.logger.debug(f"📍 Removed {element.display_name} from workspace")
+            self.logger.debug("📍 Removed %s from workspace", element.display_name)
         else:
-            self.logger.debug(f"❌ Element {element.display_name} not found in workspace")
+            self.logger.debug("❌ Element %s not found in workspace", element.display_name)
 
         return removed
 
@@ -366,31 +425,74 @@ class WorkspaceService:
         start_time = time.time()
         poll_interval = GameMechanics.POLL_INTERVAL
 
-        self.logger.debug(f"⏰ Waiting up to {max_wait}s for '{element_name}' to appear in workspace")
+        self.logger.debug("⏰ Waiting up to %ss for '%s' to appear in workspace", max_wait, element_name)
 
         while (time.time() - start_time) < max_wait:
-            current_workspace = self.get_workspace_elements()
+            # Probe in the browser so only the matching item id crosses the driver boundary while polling
+            matched_id = self.browser.execute_script(WORKSPACE_FIND_ITEM_JS, element_name)
 
-            # Check if workspace changed (element appeared)
-            if len(current_workspace) != len(initial_workspace):
-                self.logger.debug(f"✅ Workspace changed: {len(initial_workspace)} → {len(current_workspace)} elements")
+            if matched_id is not None:
+                current_workspace = self.get_workspace_elements()
+                self.logger.debug(
+                    "✅ Target element '%s' appeared in workspace: %s → %s elements",
+                    element_name,
+                    len(initial_workspace),
+                    len(current_workspace),
+                )
                 return current_workspace
 
-            # Check if specific element appeared
-            for elem in current_workspace:
-                if element_name.lower() in elem.element.name.lower():
-                    self.logger.debug(f"✅ Target element '{element_name}' appeared in workspace")
-                    return current_workspace
-
             time.sleep(poll_interval)
 
         # Timeout - return current state anyway
         final_workspace = self.get_workspace_elements()
         elapsed = time.time() - start_time
-        self.logger.debug(f"⏰ Element wait timeout after {elapsed:.3f}s - returning current workspace")
+        self.logger.debug("⏰ Element wait timeout after %.3fs - returning current workspace", elapsed)
 
         return final_workspace
 
+    def wait_for_workspace_growth(self, initial_count: int, max_wait: float) -> List[PositionedElement]:
+        """
+        Poll until the workspace holds more elements than before, up to max_wait.
+
+        Args:
+            initial_count: Number of workspace elements before the drag
+            max_wait: Maximum wait time in seconds
+
+        Returns:
+            Updated workspace elements list
+        """
+        import time
+
+        deadline = time.time() + max_wait
+        current_workspace = self.get_workspace_elements()
+        while len(current_workspace) <= initial_count and time.time() < deadline:
+            time.sleep(GameMechanics.POLL_INTERVAL)
+            current_workspace = self.get_workspace_elements()
+
+        return current_workspace
+
+    def wait_for_workspace_settle(self, max_wait: float) -> bool:
+        """
+        Wait for merge animations and DOM updates in the workspace to finish.
+
+        Returns as soon as the workspace stops mutating, so max_wait is only paid in full
+        when the page is still busy. Falls back to sleeping max_wait if the browser wait fails.
+
+        Args:
+            max_wait: Maximum wait time in seconds
+
+        Returns:
+            True if the workspace settled before max_wait
+        """
+        try:
+            return self.browser.wait_for_stable_dom(WORKSPACE_SELECTOR, max_wait)
+        except Exception as e:
+            import time
+
+            self.logger.debug(f"⚠️ Workspace settle wait failed, sleeping instead: {e}")
+            time.sleep(max_wait)
+            return False
+
     def has_element_in_workspace(self, element_name: str) -> bool:
         """Check if workspace contains an element with given name."""
         return self.workspace.has_element_named(element_name)
@@ -13,11 +13,13 @@ IMPROVEMENTS:
 """
 
 import time
+import traceback
+from collections import deque
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Deque, Dict, Iterator, List, Optional
 
 from application.services import AutomationOrchestrator, BrowserService, CacheService, LoggingService
-from config import config
+from domain.models import Combination, CombinationResult, Element
 
 
 class ServiceAutomationController:
@@ -37,11 +39,19 @@ class ServiceAutomationController:
                            Defaults to discovery strategy with 20 elements
             log_level: Logging level for services
         """
+        from config import config
+
         # Create services with dependency injection using config LOG_LEVEL if no override
         effective_log_level = log_level if log_level != "INFO" else config.LOG_LEVEL
-        self.logger = LoggingService(log_level=effective_log_level)
+        self.logger = LoggingService(
+            log_level=effective_log_level,
+            buffer_size=config.LOG_BUFFER_SIZE,
+            flush_interval=config.LOG_FLUSH_INTERVAL,
+        )
         self.browser = BrowserService(headless=False, logging_service=self.logger)
-        self.cache = CacheService(config.AUTOMATION_CACHE_FILE, logging_service=self.logger)
+        self.cache = CacheService(
+            config.AUTOMATION_CACHE_FILE, logging_service=self.logger, journal_path=config.AUTOMATION_CACHE_JOURNAL
+        )
 
         # Create orchestrator with injected services
         self.automation = AutomationOrchestrator(
@@ -63,6 +73,7 @@ class ServiceAutomationController:
 
         # Progress tracking (same as original)
         self.elements_created_this_session = 0
+        self.combinations_tested_this_session = 0
         self.attempts_since_last_success = 0
 
         # Extract strategy-specific config from global config
@@ -71,10 +82,14 @@ class ServiceAutomationController:
             "max_attempts_between_success", config.MAX_ATTEMPTS_BETWEEN_SUCCESS
         )
         self.max_attempts_before_clear = self.config.get("max_attempts_before_clear", config.MAX_ATTEMPTS_BEFORE_CLEAR)
+        self.drag_max_retries = self.config.get("drag_max_retries", config.DRAG_MAX_RETRIES)
+        self.combination_processing_delay = self.config.get(
+            "combination_processing_delay", config.COMBINATION_PROCESSING_DELAY
+        )
 
-    def log(self, level: str, message: str):
-        """Enhanced logging wrapper - same API as original."""
-        self.logger.log(level, message)
+    def log(self, level: str, message: str, *args):
+        """Enhanced logging wrapper - same API as original, plus lazy %-style args."""
+        self.logger.log(level, message, *args)
 
     def connect_to_browser(self, port: int = 9222) -> bool:
         """
@@ -86,7 +101,9 @@ class ServiceAutomationController:
         """
         return self.automation.connect_to_game(port)
 
-    def _try_combination_with_retry(self, word1: str, word2: str, max_retries: Optional[int] = None) -> Optional[Dict]:
+    def _try_combination_with_retry(
+        self, word1: str, word2: str, max_retries: Optional[int] = None
+    ) -> Optional[CombinationResult]:
         """
         Try a combination with retry mechanism using new service architecture.
 
@@ -96,46 +113,74 @@ class ServiceAutomationController:
         Args:
             word1: First element name
             word2: Second element name
-            max_retries: Maximum number of retry attempts
+            max_retries: Maximum number of attempts; failed attempts back off exponentially from POLL_INTERVAL
 
         Returns:
-            Dictionary with result information, or None if all attempts failed
+            The successful CombinationResult, or None if no new element was created
         """
-        max_retries = max_retries or config.DRAG_MAX_RETRIES
-        for attempt in range(max_retries):
-            attempt_num = attempt + 1
+        from config import config
 
-            if attempt > 0:
-                self.log("INFO", f"🔄 Retry attempt {attempt_num}/{max_retries} for {word1} + {word2}")
+        max_retries = max_retries or self.drag_max_retries
+        retry_delay = config.POLL_INTERVAL
+        attempt = 0
+
+        while attempt < max_retries:
+            attempt += 1
 
             # Use new service architecture for testing combination
             result = self.automation.test_combination(word1, word2)
 
-            if result is not None:
-                if hasattr(result, "is_successful") and result.is_successful:
-                    # Success with new element created
-                    if attempt > 0:
-                        self.log("INFO", f"✅ Retry successful on attempt {attempt_num}")
-
-                    # Convert to original format for compatibility
-                    return {"name": result.result_element.name, "emoji": result.result_element.emoji, "success": True}
-                elif hasattr(result, "drag_successful") and result.drag_successful and not result.new_element:
-                    # Drag worked but no new element (don't retry)
-                    self.log("INFO", f"✅ Combination attempted on attempt {attempt_num} - drag worked, no new element")
-                    return None  # Indicate no new element, but don't retry
-                else:
-                    # Failed combination - already tested and cached, don't call again
-                    self.log("INFO", f"❌ Combination failed on attempt {attempt_num} - {word1} + {word2}")
-                    return None  # Failed but don't retry
-            else:
-                # True drag failure - elements never appeared on board
-                if attempt < max_retries - 1:
-                    self.log("WARNING", f"⚠️ Attempt {attempt_num} failed for {word1} + {word2} - will retry")
-                else:
-                    self.log("WARNING", f"❌ All {max_retries} attempts failed for {word1} + {word2}")
+            if result is None or result.should_retry:
+                # Drag failure, error, or element missing from the sidebar - back off, then try again
+                if attempt < max_retries:
+                    self.log("WARNING", "⚠️ Attempt %s failed for %s + %s - will retry", attempt, word1, word2)
+                    time.sleep(retry_delay)
+                    retry_delay *= 2
+                    self.log("INFO", "🔄 Retry attempt %s/%s for %s + %s", attempt + 1, max_retries, word1, word2)
+                continue
 
+            if result.is_successful:
+                # Success with new element created
+                if attempt > 1:
+                    self.log("INFO", "✅ Retry successful on attempt %s", attempt)
+
+                return result
+
+            # Legitimate no result - the drop happened, so another attempt can't change the outcome
+            self.log("INFO", "⚪ No new element on attempt %s - %s + %s (not retrying)", attempt, word1, word2)
+            return None
+
+        self.log("WARNING", "❌ All %s attempts failed for %s + %s", max_retries, word1, word2)
         return None
 
+    def _next_untested_combination(self, untested_combinations: Deque[Iterator[Combination]]) -> Optional[Combination]:
+        """Take the next untested combination from the queued batches, dropping exhausted ones."""
+        while untested_combinations:
+            combination = next(untested_combinations[0], None)
+            if combination is not None:
+                return combination
+            untested_combinations.popleft()
+        return None
+
+    def _queue_new_element_combinations(
+        self, untested_combinations: Deque[Iterator[Combination]], known_elements: List[Element]
+    ) -> List[Element]:
+        """
+        Append combinations for elements that appeared in the sidebar since known_elements.
+
+        Returns:
+            The refreshed list of available elements
+        """
+        available_elements = self.automation.get_available_elements()
+        known_keys = {elem.cache_key for elem in known_elements}
+        new_elements = [elem for elem in available_elements if elem.cache_key not in known_keys]
+
+        if new_elements:
+            untested_combinations.append(self.cache.iter_untested_combinations_with(new_elements, known_elements))
+            self.log("DEBUG", "➕ Queued combinations for %s new element(s)", len(new_elements))
+
+        return available_elements
+
     def run_element_discovery(self) -> bool:
         """
         Run element discovery automation using new service architecture.
@@ -158,80 +203,94 @@ class ServiceAutomationController:
             self.log("INFO", "🧹 Clearing workspace for fresh start...")
             clear_success = self.automation.workspace_manager.clear_workspace()
             if clear_success:
-                self.log("INFO", "🧹 ✅ Browser workspace cleared successfully")
+                self.log("INFO", "✅ Browser workspace cleared successfully")
             else:
-                self.log("WARNING", "🧹 ⚠️ Browser workspace clear may have failed, continuing anyway...")
+                self.log("WARNING", "⚠️ Browser workspace clear may have failed, continuing anyway...")
 
             # Main discovery loop
-            start_time = time.time()
-            combinations_tested = 0
+            start_time = time.monotonic()
 
-            while self.elements_created_this_session < self.target_new_elements:
-                # Get available elements
-                available_elements = self.automation.get_available_elements()
+            # Untested pairs are generated lazily in batches; discoveries queue a batch for their new pairs only
+            available_elements = self.automation.get_available_elements()
 
-                if len(available_elements) < 2:
-                    self.log("ERROR", "❌ Not enough elements available for combinations")
-                    break
+            untested_combinations = deque()
+            if len(available_elements) < 2:
+                self.log("ERROR", "❌ Not enough elements available for combinations")
+            else:
+                untested_combinations.append(self.cache.iter_untested_combinations(available_elements))
+
+            # Session-constant lookups, resolved once rather than on every iteration
+            workspace_manager = self.automation.workspace_manager
+            settle_delay = self.combination_processing_delay
 
-                # Get untested combinations
-                untested_combinations = self.automation.get_untested_combinations()
+            # Failures left before the next workspace clear; reset by a clear or a success
+            attempts_until_clear = self.max_attempts_before_clear
+
+            while self.elements_created_this_session < self.target_new_elements:
+                combination = self._next_untested_combination(untested_combinations)
 
-                if not untested_combinations:
+                if combination is None:
                     self.log("WARNING", "⚠️ No more untested combinations available")
                     break
 
                 # Test a combination
-                combination = untested_combinations[0]
-                self.log("INFO", f"🧪 Testing combination {combinations_tested + 1}: {combination.display_name}")
+                self.log(
+                    "INFO",
+                    "🧪 Testing combination %s: %s",
+                    self.combinations_tested_this_session + 1,
+                    combination.display_name,
+                )
 
                 result = self._try_combination_with_retry(combination.element1.name, combination.element2.name)
 
-                combinations_tested += 1
+                self.combinations_tested_this_session += 1
 
-                if result and result.get("success"):
+                if result is not None:
                     self.elements_created_this_session += 1
                     self.attempts_since_last_success = 0
+                    attempts_until_clear = self.max_attempts_before_clear
+                    available_elements = self._queue_new_element_combinations(untested_combinations, available_elements)
 
                     self.log(
                         "INFO",
-                        f"🎉 SUCCESS! Created {result['name']} ({
-                            self.elements_created_this_session}/{self.target_new_elements})",
+                        "🎉 SUCCESS! Created %s (%s/%s)",
+                        result.result_element.name,
+                        self.elements_created_this_session,
+                        self.target_new_elements,
                     )
                 else:
                     self.attempts_since_last_success += 1
+                    attempts_until_clear -= 1
 
                 # Check if too many attempts without success
                 if self.attempts_since_last_success >= self.max_attempts_between_success:
-                    self.log("WARNING", f"⚠️ {self.max_attempts_between_success} attempts without success - stopping")
+                    self.log("WARNING", "⚠️ %s attempts without success - stopping", self.max_attempts_between_success)
                     break
 
                 # Check if we should clear workspace after too many attempts
-                if (
-                    self.attempts_since_last_success > 0
-                    and self.attempts_since_last_success % self.max_attempts_before_clear == 0
-                ):
-                    self.log("INFO", f"🧹 Clearing workspace after {self.max_attempts_before_clear} attempts")
-                    cleared_count = self.automation.workspace_manager.clear_workspace_tracking()
-                    self.log("INFO", f"🧹 Cleared workspace - {cleared_count} elements removed")
+                if attempts_until_clear == 0:
+                    self.log("INFO", "🧹 Clearing workspace after %s attempts", self.max_attempts_before_clear)
+                    cleared_count = workspace_manager.clear_workspace_tracking()
+                    self.log("INFO", "🧹 Cleared workspace - %s elements removed", cleared_count)
+                    attempts_until_clear = self.max_attempts_before_clear
 
-                # Brief pause between combinations (use config)
-                time.sleep(config.COMBINATION_PROCESSING_DELAY)
+                # Let the workspace settle; COMBINATION_PROCESSING_DELAY is only the upper bound
+                workspace_manager.wait_for_workspace_settle(settle_delay)
 
             # Session summary
-            duration = time.time() - start_time
-            stats = self.automation.get_session_stats()
+            duration = time.monotonic() - start_time
 
             self.log("INFO", "=" * 50)
             self.log("INFO", "📊 DISCOVERY SESSION COMPLETE")
             self.log("INFO", "=" * 50)
-            self.log("INFO", f"🎯 Elements Created: {self.elements_created_this_session}/{self.target_new_elements}")
-            self.log("INFO", f"🧪 Combinations Tested: {combinations_tested}")
-            self.log("INFO", f"⏱️ Duration: {duration / 60:.1f} minutes")
+            self.log("INFO", "🎯 Elements Created: %s/%s", self.elements_created_this_session, self.target_new_elements)
+            self.log("INFO", "🧪 Combinations Tested: %s", self.combinations_tested_this_session)
+            self.log("INFO", "⏱️ Duration: %.1f minutes", duration / 60)
             self.log(
                 "INFO",
-                f"📈 Success Rate: {stats.get(
-                    'session_combinations_successful', 0)}/{stats.get('session_combinations_tested', 0)}",
+                "📈 Success Rate: %s/%s",
+                self.elements_created_this_session,
+                self.combinations_tested_this_session,
             )
 
             # Save if configured
@@ -248,15 +307,15 @@ class ServiceAutomationController:
             else:
                 self.log(
                     "INFO",
-                    f"⚠️ Partial success: {
-                        self.elements_created_this_session}/{self.target_new_elements} elements created",
+                    "⚠️ Partial success: %s/%s elements created",
+                    self.elements_created_this_session,
+                    self.target_new_elements,
                 )
 
             return success
 
         except Exception as e:
             self.log("ERROR", f"❌ Discovery automation failed: {e}")
-            import traceback
 
             traceback.print_exc()
             return False
@@ -269,7 +328,8 @@ class ServiceAutomationController:
         Returns:
             Dict: Comprehensive automation results
         """
-        automation_start = datetime.now()
+        automation_start = datetime.now()  # Wall clock for the report only; durations use the monotonic clock
+        run_start = time.monotonic()
 
         self.log("INFO", "🏁 STARTING COMPLETE AUTOMATION")
         self.log("INFO", f"🔧 Strategy: {self.config.get('type', 'element_discovery')}")
@@ -296,14 +356,13 @@ class ServiceAutomationController:
 
             # Step 3: Compile results
             automation_end = datetime.now()
-            duration = (automation_end - automation_start).total_seconds() / 60
-            stats = self.automation.get_session_stats()
+            duration = (time.monotonic() - run_start) / 60
 
             results = {
                 "success": success,
                 "strategy": strategy_type,
                 "elements_created": self.elements_created_this_session,
-                "combinations_tested": stats.get("session_combinations_tested", 0),
+                "combinations_tested": self.combinations_tested_this_session,
                 "duration_minutes": round(duration, 2),
                 "session_start": automation_start.isoformat(),
                 "session_end": automation_end.isoformat(),
@@ -312,7 +371,7 @@ class ServiceAutomationController:
             }
 
             self.log("INFO", "🏁 AUTOMATION COMPLETE")
-            self.log("INFO", f"📊 Results: {results}")
+            self.log("INFO", "📊 Results: %s", results)
 
             return results
 
@@ -322,13 +381,17 @@ class ServiceAutomationController:
                 "success": False,
                 "error": str(e),
                 "elements_created": self.elements_created_this_session,
-                "duration_minutes": (datetime.now() - automation_start).total_seconds() / 60,
+                "duration_minutes": (time.monotonic() - run_start) / 60,
             }
+        finally:
+            # Callers print results right after this returns
+            self.logger.flush()
 
     def close(self):
         """Clean up automation resources - same API as original."""
         self.log("INFO", "🔚 Closing automation controller...")
         self.automation.close()
+        self.logger.flush()
 
 
 # Entry point function for backward compatibility
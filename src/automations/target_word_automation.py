@@ -12,12 +12,12 @@ IMPROVEMENTS:
 - Fully testable semantic logic
 """
 import time
+import traceback
 from datetime import datetime
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from application.services import SemanticService
-from config import config
-from domain.models import Combination, Element
+from domain.models import Combination, Discovery, Element
 
 from .automation_controller import ServiceAutomationController
 
@@ -42,6 +42,8 @@ class ServiceTargetWordAutomation(ServiceAutomationController):
                 - test_alpha_weights: Whether to test different semantic merge weights
             log_level: Logging level for services
         """
+        from config import config
+
         # Default strategy configuration for target word hunting
         default_config = {
             "type": "target_word_hunter",
@@ -62,6 +64,7 @@ class ServiceTargetWordAutomation(ServiceAutomationController):
 
         # Target word hunting specific attributes from global config
         self.target_word = self.config.get("target_word", "Dragon")
+        self.target_key = self.target_word.lower().strip()  # Normalized like Element.cache_key
         self.max_attempts = self.config.get("max_attempts", config.TARGET_WORD_MAX_ATTEMPTS)
         self.top_combinations_per_iteration = self.config.get(
             "top_combinations_per_iteration", config.TOP_COMBINATIONS_PER_ITERATION
@@ -69,27 +72,47 @@ class ServiceTargetWordAutomation(ServiceAutomationController):
         self.semantic_threshold = self.config.get("semantic_threshold", 0.3)
 
         # Initialize semantic service
-        self.semantic_service = SemanticService()
+        # Self-combinations are rejected by the domain, so don't spend similarity work on them
+        self.semantic_service = SemanticService(
+            include_self_pairs=False,
+            candidate_pool_size=self.config.get("semantic_candidate_pool", config.SEMANTIC_CANDIDATE_POOL),
+            logging_service=self.logger,
+        )
 
         # Target hunting statistics
         self.target_found = False
         self.target_element = None
         self.attempt_count = 0
-        self.discoveries_made = []
+        self.discoveries_made: List[Discovery] = []
 
         self.log("INFO", "🎯 TARGET WORD HUNTER INITIALIZED")
         self.log("INFO", f"🎪 Target Word: {self.target_word}")
         self.log("INFO", f"🎯 Max Attempts: {self.max_attempts}")
 
-    def find_semantic_combinations(self, available_elements: List[Element]) -> List[Tuple[Combination, float]]:
+    @staticmethod
+    def index_elements_by_name(available_elements: List[Element]) -> Dict[str, Element]:
+        """
+        Map each element's cache key to the element.
+
+        The first element wins on duplicate names, matching a linear matches_name scan.
+        """
+        elements_by_name = {}
+        for elem in available_elements:
+            elements_by_name.setdefault(elem.cache_key, elem)
+        return elements_by_name
+
+    def find_semantic_combinations(
+        self, available_elements: List[Element], elements_by_name: Optional[Dict[str, Element]] = None
+    ) -> List[Tuple[Combination, float]]:
         """
         Find combinations with highest semantic similarity to target word.
 
         Args:
             available_elements: List of available Element domain models
+            elements_by_name: Name index of available_elements (built if not given)
 
         Returns:
-            List of (Combination, similarity_score) tuples, sorted by score
+            List of (Combination, similarity_score) tuples, highest score first
         """
         try:
             # Convert elements to strings for semantic finder
@@ -99,13 +122,17 @@ class ServiceTargetWordAutomation(ServiceAutomationController):
             semantic_combinations = self.semantic_service.find_best_combinations(
                 available_words=element_names,
                 target_word=self.target_word,
-                top_k=self.top_combinations_per_iteration * 2,  # Get extra for filtering
-                cache_service=self.automation.cache,  # Enable cache filtering!
+                top_k=self.top_combinations_per_iteration,
+                cache_service=self.automation.cache,  # Tested pairs are skipped before scoring
             )
 
-            # Convert back to domain models and filter untested
+            # Convert back to domain models; the service already ranks by score, so order is kept
             valid_combinations = []
 
+            # Name index for O(1) lookups
+            if elements_by_name is None:
+                elements_by_name = self.index_elements_by_name(available_elements)
+
             for combo_data in semantic_combinations:
                 # SemanticService returns different field names
                 elem1_name = combo_data.get("word1") or combo_data.get("element1")
@@ -117,45 +144,49 @@ class ServiceTargetWordAutomation(ServiceAutomationController):
                     continue
 
                 # Find domain model elements
-                elem1 = next((e for e in available_elements if e.matches_name(elem1_name)), None)
-                elem2 = next((e for e in available_elements if e.matches_name(elem2_name)), None)
+                elem1 = elements_by_name.get(elem1_name.lower().strip())
+                elem2 = elements_by_name.get(elem2_name.lower().strip())
 
                 if elem1 and elem2:
                     # Create combination using cache service (validates it)
-                    combination = self.automation.cache.create_combination_from_names(
-                        elem1_name, elem2_name, available_elements
-                    )
+                    combination = self.automation.cache.create_combination(elem1, elem2)
 
                     if combination:
                         # Cache filtering already done in SemanticService, so add directly
                         valid_combinations.append((combination, score))
+                        if len(valid_combinations) == self.top_combinations_per_iteration:
+                            break
 
-            # Sort by semantic score (highest first) and limit results
-            valid_combinations.sort(key=lambda x: x[1], reverse=True)
-            return valid_combinations[: self.top_combinations_per_iteration]
+            return valid_combinations
 
         except Exception as e:
             self.log("ERROR", f"❌ Failed to find semantic combinations: {e}")
             return []
 
-    def check_if_target_found(self, available_elements: List[Element]) -> bool:
+    def check_if_target_found(
+        self, available_elements: List[Element], elements_by_name: Optional[Dict[str, Element]] = None
+    ) -> bool:
         """
         Check if target word has been discovered among available elements.
 
         Args:
             available_elements: Current available elements
+            elements_by_name: Name index of available_elements (built if not given)
 
         Returns:
             True if target found, False otherwise
         """
-        for element in available_elements:
-            if element.matches_name(self.target_word):
-                self.target_found = True
-                self.target_element = element
-                self.log("INFO", f"🎉 TARGET FOUND: {element.display_name}")
-                return True
+        if elements_by_name is None:
+            elements_by_name = self.index_elements_by_name(available_elements)
 
-        return False
+        element = elements_by_name.get(self.target_key)
+        if element is None:
+            return False
+
+        self.target_found = True
+        self.target_element = element
+        self.log("INFO", f"🎉 TARGET FOUND: {element.display_name}")
+        return True
 
     def run_target_word_hunting(self) -> bool:
         """
@@ -178,25 +209,30 @@ class ServiceTargetWordAutomation(ServiceAutomationController):
             self.log("INFO", "🧹 Clearing workspace for fresh start...")
             clear_success = self.automation.workspace_manager.clear_workspace()
             if clear_success:
-                self.log("INFO", "🧹 ✅ Browser workspace cleared successfully")
+                self.log("INFO", "✅ Browser workspace cleared successfully")
             else:
-                self.log("WARNING", "🧹 ⚠️ Browser workspace clear may have failed, continuing anyway...")
+                self.log("WARNING", "⚠️ Browser workspace clear may have failed, continuing anyway...")
+
+            start_time = time.monotonic()
 
-            start_time = datetime.now()
-            combinations_tested = 0
+            # Session-constant lookups, resolved once rather than on every attempt
+            workspace_manager = self.automation.workspace_manager
+            settle_delay = self.combination_processing_delay
+            log_attempts = self.logger.is_enabled("INFO")
 
             while self.attempt_count < self.max_attempts and not self.target_found:
                 # Get current available elements
                 available_elements = self.automation.get_available_elements()
+                elements_by_name = self.index_elements_by_name(available_elements)
 
                 # Check if target already exists
-                if self.check_if_target_found(available_elements):
+                if self.check_if_target_found(available_elements, elements_by_name):
                     break
 
                 self.log("INFO", "🧠 Finding best semantic combinations...")
 
                 # Find semantic combinations
-                semantic_combinations = self.find_semantic_combinations(available_elements)
+                semantic_combinations = self.find_semantic_combinations(available_elements, elements_by_name)
 
                 if not semantic_combinations:
                     self.log("WARNING", "🛑 No good semantic combinations found - ending hunt")
@@ -210,60 +246,53 @@ class ServiceTargetWordAutomation(ServiceAutomationController):
                         break
 
                     self.attempt_count += 1
-                    combinations_tested += 1
-
-                    self.log(
-                        "INFO",
-                        f"🧪 Trying combination {i + 1}/{len(semantic_combinations)}: {combination.display_name}",
-                    )
-                    self.log(
-                        "INFO",
-                        f"Semantic score: {
-                            similarity_score:.3f} ({
-                            'high' if similarity_score > 0.7 else 'medium' if similarity_score > 0.5 else 'low'})",
-                    )
+                    self.combinations_tested_this_session += 1
+
+                    if log_attempts:
+                        self.log(
+                            "INFO",
+                            "🧪 Trying combination %s/%s: %s",
+                            i + 1,
+                            len(semantic_combinations),
+                            combination.display_name,
+                        )
+                        self.log(
+                            "INFO",
+                            "Semantic score: %.3f (%s)",
+                            similarity_score,
+                            "high" if similarity_score > 0.7 else "medium" if similarity_score > 0.5 else "low",
+                        )
 
                     # Test the combination
                     result = self._try_combination_with_retry(combination.element1.name, combination.element2.name)
 
-                    # Handle result - could be dict with success key, CombinationResult object, or None
-                    if result:
-                        # Check if it's a dictionary format (legacy compatibility)
-                        if isinstance(result, dict) and result.get("success"):
-                            new_element_name = result["name"]
-                            new_element_emoji = result["emoji"]
-                        # Check if it's a CombinationResult object
-                        elif hasattr(result, "is_successful") and result.is_successful and result.result_element:
-                            new_element_name = result.result_element.display_name
-                            new_element_emoji = getattr(
-                                result.result_element, "emoji", result.result_element.display_name[:2]
-                            )
-                        else:
-                            continue  # Skip if result format is unexpected
+                    # Handle result - a successful CombinationResult, or None
+                    if result and result.result_element:
+                        new_element = result.result_element
+                        new_element_name = new_element.name
+                        new_element_emoji = new_element.emoji
 
                         self.discoveries_made.append(
-                            {
-                                "combination": combination.display_name,
-                                "result": f"{new_element_emoji} {new_element_name}",
-                                "similarity": similarity_score,
-                            }
+                            Discovery(
+                                combination.display_name, f"{new_element_emoji} {new_element_name}", similarity_score
+                            )
                         )
 
-                        self.log("INFO", f"🆕 DISCOVERY: {new_element_name} {new_element_emoji}")
+                        self.log("INFO", "🆕 DISCOVERY: %s %s", new_element_name, new_element_emoji)
 
                         # Check if this is our target
-                        if new_element_name.lower() == self.target_word.lower():
+                        if new_element.cache_key == self.target_key:
                             self.target_found = True
                             self.target_element = Element(
                                 name=new_element_name,
                                 emoji=new_element_emoji,
                                 element_id=f"target_{new_element_name.lower()}",
                             )
-                            self.log("INFO", f"🎯 TARGET FOUND: {new_element_name} {new_element_emoji}")
+                            self.log("INFO", "🎯 TARGET FOUND: %s %s", new_element_name, new_element_emoji)
                             break
 
-                    # Brief pause between attempts (use config)
-                    time.sleep(config.COMBINATION_PROCESSING_DELAY)
+                    # Let the workspace settle; COMBINATION_PROCESSING_DELAY is only the upper bound
+                    workspace_manager.wait_for_workspace_settle(settle_delay)
 
                     # Check attempt limit
                     if self.attempt_count >= self.max_attempts:
@@ -271,7 +300,7 @@ class ServiceTargetWordAutomation(ServiceAutomationController):
                         break
 
             # Session summary
-            duration = (datetime.now() - start_time).total_seconds() / 60
+            duration = (time.monotonic() - start_time) / 60
 
             self.log("INFO", "=" * 60)
             self.log("INFO", "🎯 TARGET HUNT SESSION COMPLETE")
@@ -284,10 +313,9 @@ class ServiceTargetWordAutomation(ServiceAutomationController):
 
             self.log("INFO", f"⏱️ Duration: {duration:.1f} minutes")
             self.log("INFO", f"🧪 Attempts Made: {self.attempt_count}")
-            self.log("INFO", f"📊 Combinations Tested: {combinations_tested}")
+            self.log("INFO", "📊 Combinations Tested: %s", self.combinations_tested_this_session)
             self.log("INFO", f"🆕 Elements Created: {len(self.discoveries_made)}")
 
-            self.automation.get_session_stats()
             self.log("INFO", f"📈 Final Element Count: {len(self.automation.get_available_elements())}")
 
             if self.discoveries_made:
@@ -295,7 +323,7 @@ class ServiceTargetWordAutomation(ServiceAutomationController):
                 for i, discovery in enumerate(self.discoveries_made, 1):
                     self.log(
                         "INFO",
-                        f"{i}. {discovery['combination']} = {discovery['result']} (🧠 {discovery['similarity']:.3f})",
+                        f"{i}. {discovery.combination} = {discovery.result} (🧠 {discovery.similarity:.3f})",
                     )
 
             if self.target_found:
@@ -311,7 +339,6 @@ class ServiceTargetWordAutomation(ServiceAutomationController):
 
         except Exception as e:
             self.log("ERROR", f"❌ Target word hunting failed: {e}")
-            import traceback
 
             traceback.print_exc()
             return False
@@ -325,7 +352,8 @@ class ServiceTargetWordAutomation(ServiceAutomationController):
         Returns:
             Dict: Comprehensive automation results
         """
-        automation_start = datetime.now()
+        automation_start = datetime.now()  # Wall clock for the report only; durations use the monotonic clock
+        run_start = time.monotonic()
 
         self.log("INFO", "🏁🏁🏁🏁🏁🏁🏁🏁🏁🏁🏁🏁🏁🏁🏁🏁🏁🏁🏁🏁")
         self.log("INFO", "🏁 TARGET HUNT STARTING")
@@ -356,8 +384,7 @@ class ServiceTargetWordAutomation(ServiceAutomationController):
 
             # Compile comprehensive results
             automation_end = datetime.now()
-            duration = (automation_end - automation_start).total_seconds() / 60
-            stats = self.automation.get_session_stats()
+            duration = (time.monotonic() - run_start) / 60
 
             results = {
                 "success": success,
@@ -365,7 +392,7 @@ class ServiceTargetWordAutomation(ServiceAutomationController):
                 "target_found": self.target_found,
                 "target_element": self.target_element.to_dict() if self.target_element else None,
                 "attempts_made": self.attempt_count,
-                "combinations_tested": stats.get("session_combinations_tested", 0),
+                "combinations_tested": self.combinations_tested_this_session,
                 "elements_created": len(self.discoveries_made),
                 "discoveries": self.discoveries_made,
                 "duration_minutes": round(duration, 2),
@@ -397,8 +424,11 @@ class ServiceTargetWordAutomation(ServiceAutomationController):
                 "error": str(e),
                 "target_found": False,
                 "elements_created": len(self.discoveries_made),
-                "duration_minutes": (datetime.now() - automation_start).total_seconds() / 60,
+                "duration_minutes": (time.monotonic() - run_start) / 60,
             }
+        finally:
+            # Callers print results right after this returns
+            self.logger.flush()
 
 
 # Entry point function for backward compatibility
@@ -440,7 +470,6 @@ def main():
         return False
     except Exception as e:
         print(f"❌ Target hunt failed: {e}")
-        import traceback
 
         traceback.print_exc()
         return False
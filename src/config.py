@@ -29,6 +29,9 @@ class Config:
     or .env file.
     """
 
+    # Environment-specific defaults, used in place of the base defaults when a variable is unset
+    DEFAULT_OVERRIDES: Dict[str, Any] = {}
+
     def __init__(self):
         """Initialize configuration, loading .env file if it exists."""
         # Load .env file from project root (parent of src directory)
@@ -52,6 +55,9 @@ class Config:
         # ================================
         self.CHROME_DEBUG_PORT = self._get_int_env("CHROME_DEBUG_PORT", 9222)
         self.CHROME_CONNECTION_TIMEOUT = self._get_int_env("CHROME_CONNECTION_TIMEOUT", 5)
+        self.CHROME_AUTO_LAUNCH = self._get_bool_env("CHROME_AUTO_LAUNCH", True)
+        self.CHROME_BINARY = self._get_env("CHROME_BINARY", "")
+        self.CHROME_USER_DATA_DIR = self._get_env("CHROME_USER_DATA_DIR", "~/.infinite-craft-chrome")
         self.GAME_LOAD_TIMEOUT = self._get_int_env("GAME_LOAD_TIMEOUT", 10)
         self.IMPLICIT_WAIT_TIME = self._get_float_env("IMPLICIT_WAIT_TIME", 2.0)
         self.EXPLICIT_WAIT_TIME = self._get_float_env("EXPLICIT_WAIT_TIME", 10.0)
@@ -86,6 +92,7 @@ class Config:
         # Target word automation
         self.TARGET_WORD_MAX_ATTEMPTS = self._get_int_env("TARGET_WORD_MAX_ATTEMPTS", 50)
         self.TOP_COMBINATIONS_PER_ITERATION = self._get_int_env("TOP_COMBINATIONS_PER_ITERATION", 5)
+        self.SEMANTIC_CANDIDATE_POOL = self._get_int_env("SEMANTIC_CANDIDATE_POOL", 0)
 
         # ================================
         # GAME MECHANICS SETTINGS (from utils.py)
@@ -108,6 +115,8 @@ class Config:
         # ================================
         self.LOG_LEVEL = self._get_env("LOG_LEVEL", "INFO")
         self.ENABLE_TIMING_LOGS = self._get_bool_env("ENABLE_TIMING_LOGS", True)
+        self.LOG_BUFFER_SIZE = self._get_int_env("LOG_BUFFER_SIZE", 1)
+        self.LOG_FLUSH_INTERVAL = self._get_float_env("LOG_FLUSH_INTERVAL", 1.0)
 
         # ================================
         # CACHE BEHAVIOR SETTINGS
@@ -119,6 +128,7 @@ class Config:
         # FILE PATHS AND CACHING
         # ================================
         self.AUTOMATION_CACHE_FILE = self._get_env("AUTOMATION_CACHE_FILE", "automation.cache.json")
+        self.AUTOMATION_CACHE_JOURNAL = self._get_env("AUTOMATION_CACHE_JOURNAL", "automation.cache.db")
         self.EMBEDDINGS_CACHE_FILE = self._get_env("EMBEDDINGS_CACHE_FILE", "embeddings.cache.json")
         self.SEMANTIC_MODEL_NAME = self._get_env("SEMANTIC_MODEL_NAME", "all-MiniLM-L6-v2")
 
@@ -143,26 +153,36 @@ class Config:
 
     def _get_env(self, key: str, default: str) -> str:
         """Get string environment variable with default."""
-        return os.getenv(key, default)
+        return os.environ.get(key, self.DEFAULT_OVERRIDES.get(key, default))
 
     def _get_int_env(self, key: str, default: int) -> int:
         """Get integer environment variable with default."""
+        default = self.DEFAULT_OVERRIDES.get(key, default)
+        value = os.environ.get(key)
+        if value is None:
+            return default
         try:
-            return int(os.getenv(key, str(default)))
-        except (ValueError, TypeError):
+            return int(value)
+        except ValueError:
             return default
 
     def _get_float_env(self, key: str, default: float) -> float:
         """Get float environment variable with default."""
+        default = self.DEFAULT_OVERRIDES.get(key, default)
+        value = os.environ.get(key)
+        if value is None:
+            return default
         try:
-            return float(os.getenv(key, str(default)))
-        except (ValueError, TypeError):
+            return float(value)
+        except ValueError:
             return default
 
     def _get_bool_env(self, key: str, default: bool) -> bool:
         """Get boolean environment variable with default."""
-        value = os.getenv(key, str(default)).lower()
-        return value in ("true", "1", "yes", "on", "enabled")
+        value = os.environ.get(key)
+        if value is None:
+            return self.DEFAULT_OVERRIDES.get(key, default)
+        return value.lower() in ("true", "1", "yes", "on", "enabled")
 
     def get_strategy_config(self, strategy_type: str = "default") -> Dict[str, Any]:
         """Get configuration dict for specific automation strategy.
@@ -200,31 +220,25 @@ class Config:
 class DevelopmentConfig(Config):
     """Development environment configuration with debug settings."""
 
-    def _load_config(self):
-        """Load base config then apply development overrides."""
-        super()._load_config()
-
-        # Development-specific overrides
-        self.LOG_LEVEL = self._get_env("LOG_LEVEL", "DEBUG")
-        self.ENABLE_DEBUG_LOGS = self._get_bool_env("ENABLE_DEBUG_LOGS", True)
-        self.SKIP_ENTER_PROMPT = self._get_bool_env("SKIP_ENTER_PROMPT", True)
-        self.AUTO_ASSUME_WEBSITE_READY = self._get_bool_env("AUTO_ASSUME_WEBSITE_READY", True)
+    DEFAULT_OVERRIDES = {
+        "LOG_LEVEL": "DEBUG",
+        "ENABLE_DEBUG_LOGS": True,
+        "SKIP_ENTER_PROMPT": True,
+        "AUTO_ASSUME_WEBSITE_READY": True,
         # Faster iteration in development
-        self.KEEP_BROWSER_OPEN_DELAY = self._get_float_env("KEEP_BROWSER_OPEN_DELAY", 2.0)
+        "KEEP_BROWSER_OPEN_DELAY": 2.0,
+    }
 
 
 class ProductionConfig(Config):
     """Production environment configuration with optimized settings."""
 
-    def _load_config(self):
-        """Load base config then apply production overrides."""
-        super()._load_config()
-
-        # Production-specific overrides
-        self.LOG_LEVEL = self._get_env("LOG_LEVEL", "INFO")
-        self.ENABLE_DEBUG_LOGS = self._get_bool_env("ENABLE_DEBUG_LOGS", False)
-        self.AUTO_ASSUME_WEBSITE_READY = self._get_bool_env("AUTO_ASSUME_WEBSITE_READY", True)
-        self.SKIP_ENTER_PROMPT = self._get_bool_env("SKIP_ENTER_PROMPT", True)
+    DEFAULT_OVERRIDES = {
+        "LOG_LEVEL": "INFO",
+        "ENABLE_DEBUG_LOGS": False,
+        "AUTO_ASSUME_WEBSITE_READY": True,
+        "SKIP_ENTER_PROMPT": True,
+    }
 
 
 # ================================
@@ -249,5 +263,18 @@ def get_config() -> Config:
         return Config()
 
 
-# Global configuration instance
-config = get_config()
+# Global configuration instance, created on first access so importing this module
+# doesn't read .env or the environment until a value is actually needed
+config: Config
+_config = None
+
+
+def __getattr__(name: str) -> Any:
+    """Create the global `config` instance on first access."""
+    global _config
+
+    if name == "config":
+        if _config is None:
+            _config = get_config()
+        return _config
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
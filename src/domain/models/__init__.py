@@ -1,6 +1,6 @@
 """Domain models for Infinite Craft automation."""
 
-from .combination import Combination, CombinationResult, CombinationStatus
+from .combination import Combination, CombinationResult, CombinationStatus, Discovery
 from .element import Element, ElementPosition, ElementSource, PositionedElement
 from .workspace import Workspace, WorkspaceLocation
 
@@ -12,6 +12,7 @@ __all__ = [
     "Combination",
     "CombinationResult",
     "CombinationStatus",
+    "Discovery",
     "Workspace",
     "WorkspaceLocation",
 ]
@@ -1,6 +1,6 @@
 """Domain model for element combinations."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Optional
@@ -19,34 +19,47 @@ class CombinationStatus(Enum):
     ERROR = "error"  # Error during combination
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True, eq=False)
 class Combination:
     """
     Domain model representing an element combination.
 
     Tracks two elements being combined and the result.
     Immutable to ensure data consistency.
+
+    Equality and hashing use the order-independent cache key, so A + B equals
+    B + A regardless of elements' metadata or attempt times.
+
+    attempted_at is only set by whoever actually attempts the combination;
+    candidates built just to be considered stay unstamped.
     """
 
     element1: Element
     element2: Element
     attempted_at: Optional[datetime] = None
+    _cache_key: str = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Validate combination on creation."""
         if self.element1 == self.element2:
             raise ValueError("Cannot combine element with itself")
 
-        # Auto-set attempt time if not provided
-        if self.attempted_at is None:
-            object.__setattr__(self, "attempted_at", datetime.now())
+        # Always order elements for consistent caching
+        key1, key2 = self.element1.cache_key, self.element2.cache_key
+        object.__setattr__(self, "_cache_key", f"{key1}+{key2}" if key1 <= key2 else f"{key2}+{key1}")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Combination):
+            return NotImplemented
+        return self._cache_key == other._cache_key
+
+    def __hash__(self) -> int:
+        return hash(self._cache_key)
 
     @property
     def cache_key(self) -> str:
         """Get normalized cache key for this combination."""
-        # Always sort elements for consistent caching
-        names = sorted([self.element1.cache_key, self.element2.cache_key])
-        return "+".join(names)
+        return self._cache_key
 
     @property
     def display_name(self) -> str:
@@ -72,7 +85,7 @@ class Combination:
         return self.element1.cache_key == name_key or self.element2.cache_key == name_key
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class CombinationResult:
     """
     Result of attempting a combination.
@@ -92,15 +105,16 @@ class CombinationResult:
         if self.completed_at is None:
             object.__setattr__(self, "completed_at", datetime.now())
 
-        # Validate status consistency
-        if self.status == CombinationStatus.SUCCESS and self.result_element is None:
-            raise ValueError("Success status requires a result element")
+        # Validate status consistency (skipped under python -O; the factory classmethods build valid results)
+        if __debug__:
+            if self.status == CombinationStatus.SUCCESS and self.result_element is None:
+                raise ValueError("Success status requires a result element")
 
-        if self.status != CombinationStatus.SUCCESS and self.result_element is not None:
-            raise ValueError("Non-success status cannot have a result element")
+            if self.status != CombinationStatus.SUCCESS and self.result_element is not None:
+                raise ValueError("Non-success status cannot have a result element")
 
-        if self.status == CombinationStatus.ERROR and not self.error_message:
-            raise ValueError("Error status requires an error message")
+            if self.status == CombinationStatus.ERROR and not self.error_message:
+                raise ValueError("Error status requires an error message")
 
     @property
     def is_successful(self) -> bool:
@@ -142,3 +156,16 @@ class CombinationResult:
     def error(cls, combination: Combination, error: str) -> "CombinationResult":
         """Create an error combination result."""
         return cls(combination=combination, status=CombinationStatus.ERROR, error_message=error)
+
+
+@dataclass(slots=True, frozen=True)
+class Discovery:
+    """
+    A new element found during a target word hunt.
+
+    Slotted so a long hunt keeps its discovery log compact.
+    """
+
+    combination: str
+    result: str
+    similarity: float
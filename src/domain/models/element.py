@@ -1,6 +1,7 @@
 """Domain model for game elements."""
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Optional
@@ -14,7 +15,7 @@ class ElementSource(Enum):
     IMPORTED = "imported"  # Loaded from cache/save file
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class ElementPosition:
     """Represents an element's position in the game."""
 
@@ -23,14 +24,26 @@ class ElementPosition:
 
     def distance_to(self, other: "ElementPosition") -> float:
         """Calculate distance to another position."""
-        return ((self.x - other.x) ** 2 + (self.y - other.y) ** 2) ** 0.5
+        return self.sq_distance_to(other) ** 0.5
+
+    def sq_distance_to(self, other: "ElementPosition") -> int:
+        """Calculate squared distance to another position (cheaper when only comparing)."""
+        dx = self.x - other.x
+        dy = self.y - other.y
+        return dx * dx + dy * dy
 
     def is_within_tolerance(self, other: "ElementPosition", tolerance: int) -> bool:
         """Check if position is within tolerance of another position."""
-        return self.distance_to(other) <= tolerance
+        return self.sq_distance_to(other) <= tolerance * tolerance
+
+    def is_within_tolerance_sq(self, other: "ElementPosition", tolerance_sq: int) -> bool:
+        """Check if position is within a precomputed squared tolerance of another position."""
+        dx = self.x - other.x
+        dy = self.y - other.y
+        return dx * dx + dy * dy <= tolerance_sq
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class Element:
     """
     Domain model representing a game element.
@@ -45,15 +58,21 @@ class Element:
     source: ElementSource = ElementSource.DISCOVERED
     discovered_at: Optional[datetime] = None
     sidebar_index: Optional[int] = None
+    _cache_key: str = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Validate element data on creation."""
-        if not self.name.strip():
+        cache_key = self.name.lower().strip()
+        if not cache_key:
             raise ValueError("Element name cannot be empty")
 
         if not self.element_id.strip():
             raise ValueError("Element ID cannot be empty")
 
+        # Interned so every Element with the same name shares one key string (equality is an identity check)
+        object.__setattr__(self, "_cache_key", sys.intern(cache_key))
+        object.__setattr__(self, "element_id", sys.intern(self.element_id))
+
         # Auto-set discovery time if not provided
         if self.discovered_at is None and self.source == ElementSource.DISCOVERED:
             object.__setattr__(self, "discovered_at", datetime.now())
@@ -66,7 +85,7 @@ class Element:
     @property
     def cache_key(self) -> str:
         """Get normalized cache key for this element."""
-        return self.name.lower().strip()
+        return self._cache_key
 
     def is_basic_element(self) -> bool:
         """Check if this is one of the four basic starting elements."""
@@ -106,7 +125,7 @@ class Element:
         return PositionedElement(element=self, position=position)
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class PositionedElement:
     """An element with a specific position (used for workspace tracking)."""
 
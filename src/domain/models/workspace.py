@@ -1,12 +1,19 @@
 """Domain model for game workspace."""
 
+from bisect import bisect_left, bisect_right, insort
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 from .element import Element, ElementPosition, PositionedElement
 
 
+def _position_x(positioned_element: PositionedElement) -> int:
+    """Sort key for the workspace x-axis index."""
+    return positioned_element.position.x
+
+
 class WorkspaceState(Enum):
     """State of the workspace."""
 
@@ -16,7 +23,7 @@ class WorkspaceState(Enum):
     CLEARING = "clearing"
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class WorkspaceLocation:
     """Predefined location in the workspace."""
 
@@ -25,30 +32,47 @@ class WorkspaceLocation:
     is_safe: bool = True  # Whether this location is within safe bounds
 
     @classmethod
-    def create_default_locations(cls) -> List["WorkspaceLocation"]:
-        """Create the 5 predefined workspace locations from utils.py."""
-        return [
+    @lru_cache(maxsize=1)
+    def create_default_locations(cls) -> Tuple["WorkspaceLocation", ...]:
+        """Get the 5 predefined workspace locations from utils.py (immutable, so built once and shared)."""
+        return (
             cls(ElementPosition(300, 250), "Top Left", True),
             cls(ElementPosition(700, 250), "Top Right", True),
             cls(ElementPosition(350, 350), "Bottom Left", True),
             cls(ElementPosition(650, 350), "Bottom Right", True),
             cls(ElementPosition(500, 300), "Center", True),
-        ]
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class Workspace:
     """
     Domain model representing the game workspace.
 
     Tracks elements currently in the workspace and manages location assignment.
     Mutable because workspace state changes frequently during automation.
+
+    Elements are also kept sorted by x coordinate so proximity queries only
+    scan the slice within tolerance on the x-axis (sweep-and-prune), and
+    grouped by name so name lookups don't scan the workspace.
     """
 
     elements: List[PositionedElement] = field(default_factory=list)
-    predefined_locations: List[WorkspaceLocation] = field(default_factory=WorkspaceLocation.create_default_locations)
+    predefined_locations: Tuple[WorkspaceLocation, ...] = field(
+        default_factory=WorkspaceLocation.create_default_locations
+    )
     current_location_index: int = 0
     max_elements_before_clear: int = 5
+    _elements_by_x: List[PositionedElement] = field(default_factory=list, init=False, repr=False, compare=False)
+    _elements_by_name: Dict[str, List[PositionedElement]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        """Build the x-axis and name indexes for any initial elements."""
+        self._elements_by_x = sorted(self.elements, key=_position_x)
+        for positioned_elem in self.elements:
+            self._elements_by_name.setdefault(positioned_elem.element.cache_key, []).append(positioned_elem)
 
     @property
     def state(self) -> WorkspaceState:
@@ -79,29 +103,68 @@ class Workspace:
         """Add an element to the workspace at a specific position."""
         positioned_element = element.with_position(position)
         self.elements.append(positioned_element)
+        insort(self._elements_by_x, positioned_element, key=_position_x)
+        self._elements_by_name.setdefault(element.cache_key, []).append(positioned_element)
         return positioned_element
 
     def remove_element(self, element: Element) -> bool:
         """Remove an element from the workspace."""
-        for i, positioned_elem in enumerate(self.elements):
+        for positioned_elem in self.elements:
             if positioned_elem.element == element:
+                return self.remove_positioned_element(positioned_elem)
+        return False
+
+    def remove_positioned_element(self, positioned_elem: PositionedElement) -> bool:
+        """Remove one specific placed element (by identity, so equal duplicates elsewhere are kept)."""
+        for i, candidate in enumerate(self.elements):
+            if candidate is positioned_elem:
                 del self.elements[i]
+                self._remove_from_x_index(positioned_elem)
+                self._remove_from_name_index(positioned_elem)
                 return True
         return False
 
+    def _remove_from_name_index(self, positioned_elem: PositionedElement) -> None:
+        """Remove a positioned element from the name index."""
+        name_key = positioned_elem.element.cache_key
+        same_name = self._elements_by_name[name_key]
+        for index, candidate in enumerate(same_name):
+            if candidate is positioned_elem:
+                del same_name[index]
+                break
+        if not same_name:
+            del self._elements_by_name[name_key]
+
+    def _remove_from_x_index(self, positioned_elem: PositionedElement) -> None:
+        """Remove a positioned element from the x-axis index."""
+        x = positioned_elem.position.x
+        index = bisect_left(self._elements_by_x, x, key=_position_x)
+        while index < len(self._elements_by_x) and self._elements_by_x[index].position.x == x:
+            if self._elements_by_x[index] is positioned_elem:
+                del self._elements_by_x[index]
+                return
+            index += 1
+
     def find_element_by_name(self, name: str) -> Optional[PositionedElement]:
-        """Find an element in workspace by name."""
-        name_key = name.lower().strip()
-        for positioned_elem in self.elements:
-            if positioned_elem.element.cache_key == name_key:
-                return positioned_elem
-        return None
+        """Find an element in workspace by name (the earliest added, if several share it)."""
+        same_name = self._elements_by_name.get(name.lower().strip())
+        return same_name[0] if same_name else None
 
     def find_elements_near_position(
         self, target_position: ElementPosition, tolerance: int = 50
     ) -> List[PositionedElement]:
         """Find all elements within tolerance of a target position."""
-        return [elem for elem in self.elements if elem.is_near_position(target_position, tolerance)]
+        return [
+            elem
+            for elem in self.elements_in_x_range(target_position.x, tolerance)
+            if elem.is_near_position(target_position, tolerance)
+        ]
+
+    def elements_in_x_range(self, x: int, tolerance: int) -> List[PositionedElement]:
+        """Get elements whose x coordinate lies within tolerance of x, ordered by x."""
+        low = bisect_left(self._elements_by_x, x - tolerance, key=_position_x)
+        high = bisect_right(self._elements_by_x, x + tolerance, key=_position_x)
+        return self._elements_by_x[low:high]
 
     def get_next_location(self) -> WorkspaceLocation:
         """Get the next predefined location using round-robin."""
@@ -113,6 +176,8 @@ class Workspace:
         """Clear all elements from workspace and return count of removed elements."""
         count = len(self.elements)
         self.elements.clear()
+        self._elements_by_x.clear()
+        self._elements_by_name.clear()
         self.current_location_index = 0  # Reset location index
         return count
 
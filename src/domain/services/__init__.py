@@ -2,8 +2,10 @@
 
 from .combination_logic import CombinationLogic
 from .game_mechanics import GameMechanics
+from .pair_bitmap import PairBitmap
 
 __all__ = [
     "GameMechanics",
     "CombinationLogic",
+    "PairBitmap",
 ]
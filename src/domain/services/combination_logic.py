@@ -1,11 +1,12 @@
 """Business logic for element combinations."""
 
 from datetime import datetime
-from typing import Dict, List, Optional, Set
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
 
 from ..models.combination import Combination, CombinationResult, CombinationStatus
 from ..models.element import Element
 from .game_mechanics import GameMechanics
+from .pair_bitmap import PairBitmap
 
 
 class CombinationLogic:
@@ -16,11 +17,76 @@ class CombinationLogic:
     Extracted from the combination logic in utils.py.
     """
 
+    # Statuses that settle a pair's outcome: success (result element) or no result (None).
+    # Drag failures, timeouts and errors are left unsettled so they can be retried later.
+    KNOWN_OUTCOME_STATUSES = frozenset({CombinationStatus.SUCCESS, CombinationStatus.NO_RESULT})
+
     def __init__(self):
         """Initialize combination logic."""
-        self._successful_combinations: Dict[str, Element] = {}
-        self._failed_combinations: Set[str] = set()
-        self._tested_combinations: Set[str] = set()
+        # Element names are interned to small ints; pair keys are (low_id, high_id) tuples
+        self._name_ids: Dict[str, int] = {}
+        self._names: List[str] = []
+
+        # Known outcomes in one table: the result element for successful pairs, None for pairs that
+        # produce nothing. Drag failures and errors are only marked tested, since they can be retried.
+        self._known_results: Dict[Tuple[int, int], Optional[Element]] = {}
+        self._tested_combinations = PairBitmap()  # One bit per tested pair
+
+        # One shared Element per result name, so pairs producing the same element don't each hold a copy
+        self._element_registry: Dict[str, Element] = {}
+
+    def _intern(self, name_key: str) -> int:
+        """Get the integer id for a normalized element name, assigning one if new."""
+        name_id = self._name_ids.get(name_key)
+        if name_id is None:
+            name_id = len(self._names)
+            self._name_ids[name_key] = name_id
+            self._names.append(name_key)
+        return name_id
+
+    def _pair_key(self, name_key1: str, name_key2: str) -> Tuple[int, int]:
+        """Get the order-independent integer key for a pair of distinct normalized names."""
+        if name_key1 == name_key2:
+            raise ValueError(f"Cannot key a combination of '{name_key1}' with itself")
+        id1 = self._intern(name_key1)
+        id2 = self._intern(name_key2)
+        return (id1, id2) if id1 < id2 else (id2, id1)
+
+    def _key_for(self, combination: Combination) -> Tuple[int, int]:
+        """Get the integer key for a combination."""
+        return self._pair_key(combination.element1.cache_key, combination.element2.cache_key)
+
+    def _register_element(self, element: Element) -> Element:
+        """Get the shared instance for a result element, registering it if its name is new."""
+        return self._element_registry.setdefault(element.cache_key, element)
+
+    def _key_to_string(self, key: Tuple[int, int]) -> str:
+        """Convert an integer key back to the "a+b" form used in cache files."""
+        return "+".join(sorted((self._names[key[0]], self._names[key[1]])))
+
+    def _string_to_key(self, cache_key: str) -> Optional[Tuple[int, int]]:
+        """
+        Parse an "a+b" cache file key into an integer key.
+
+        Names may themselves contain "+", so only splits whose halves are in strictly
+        sorted order are candidates (a name never pairs with itself); if several
+        qualify, prefer one made of known names.
+        """
+        candidates = []
+        split = cache_key.find("+")
+        while split >= 0:
+            left, right = cache_key[:split], cache_key[split + 1 :]
+            if left and right and left < right:
+                candidates.append((left, right))
+            split = cache_key.find("+", split + 1)
+
+        if not candidates:
+            return None
+
+        for left, right in candidates:
+            if left in self._name_ids and right in self._name_ids:
+                return self._pair_key(left, right)
+        return self._pair_key(*candidates[0])
 
     def is_combination_valid(self, elem1: Element, elem2: Element) -> bool:
         """Check if combination is valid according to game rules."""
@@ -35,44 +101,66 @@ class CombinationLogic:
 
     def is_combination_tested(self, combination: Combination) -> bool:
         """Check if combination has been tested before."""
-        return combination.cache_key in self._tested_combinations
+        return self._key_for(combination) in self._tested_combinations
+
+    def is_tested_by_names(self, name1: str, name2: str) -> bool:
+        """Check if the combination of two element names has been tested."""
+        id1 = self._name_ids.get(name1.lower().strip())
+        id2 = self._name_ids.get(name2.lower().strip())
+        if id1 is None or id2 is None:
+            return False
+        return ((id1, id2) if id1 < id2 else (id2, id1)) in self._tested_combinations
+
+    def tested_names_checker(self) -> Callable[[str, str], bool]:
+        """
+        Get a checker for testing many name pairs against the tested combinations.
+
+        Each distinct name is normalized and resolved to its id once, rather than
+        once per pair, which matters when filtering all N² pairs of the sidebar.
+        The checker reads the live tested set, so results stay current.
+        """
+        name_ids = self._name_ids
+        tested = self._tested_combinations
+        resolved: Dict[str, int] = {}
+
+        def is_tested(name1: str, name2: str) -> bool:
+            id1 = resolved.get(name1)
+            if id1 is None:
+                id1 = resolved[name1] = name_ids.get(name1.lower().strip(), -1)
+            id2 = resolved.get(name2)
+            if id2 is None:
+                id2 = resolved[name2] = name_ids.get(name2.lower().strip(), -1)
+            if id1 < 0 or id2 < 0:
+                return False
+            return ((id1, id2) if id1 < id2 else (id2, id1)) in tested
+
+        return is_tested
 
     def is_combination_successful(self, combination: Combination) -> bool:
         """Check if combination is known to be successful."""
-        return combination.cache_key in self._successful_combinations
+        return self._known_results.get(self._key_for(combination)) is not None
 
     def is_combination_failed(self, combination: Combination) -> bool:
         """Check if combination is known to have failed."""
-        return combination.cache_key in self._failed_combinations
+        key = self._key_for(combination)
+        return key in self._known_results and self._known_results[key] is None
 
     def get_successful_result(self, combination: Combination) -> Optional[Element]:
         """Get the result element for a successful combination."""
-        return self._successful_combinations.get(combination.cache_key)
+        return self._known_results.get(self._key_for(combination))
 
     def record_combination_result(self, result: CombinationResult) -> None:
         """Record the result of a combination attempt."""
-        combination = result.combination
-        cache_key = combination.cache_key
+        cache_key = self._key_for(result.combination)
 
         # Mark as tested
         self._tested_combinations.add(cache_key)
 
-        # Record result based on status
-        if result.status == CombinationStatus.SUCCESS and result.result_element:
-            self._successful_combinations[cache_key] = result.result_element
-            # Remove from failed if it was there (shouldn't happen, but defensive)
-            self._failed_combinations.discard(cache_key)
-
-        elif result.status == CombinationStatus.NO_RESULT:
-            # Combination was attempted successfully but produced no result
-            self._failed_combinations.add(cache_key)
-            # Remove from successful if it was there
-            self._successful_combinations.pop(cache_key, None)
-
-        elif result.should_retry:
-            # Don't record drag failures or errors as permanently failed
-            # They can be retried later
-            pass
+        # Record the outcome in one lookup; the latest outcome replaces any earlier one.
+        # CombinationResult guarantees a result element exactly when the status is SUCCESS.
+        if result.status in self.KNOWN_OUTCOME_STATUSES:
+            element = result.result_element
+            self._known_results[cache_key] = element and self._register_element(element)
 
     def should_skip_combination(self, combination: Combination, available_elements: List[Element]) -> Optional[str]:
         """
@@ -80,78 +168,127 @@ class CombinationLogic:
 
         Returns None if should proceed, or reason string if should skip.
         """
-        # Check if already successful and result exists in available elements
-        if self.is_combination_successful(combination):
-            result_element = self.get_successful_result(combination)
-            if result_element and any(elem.matches_name(result_element.name) for elem in available_elements):
-                return f"Result '{result_element.name}' already exists in available elements"
+        # One lookup answers both "known to succeed" and "known to fail"
+        key = self._key_for(combination)
+        if key not in self._known_results:
+            return None
+
+        result_element = self._known_results[key]
 
         # Check if known to fail (but allow retry after some time)
-        if self.is_combination_failed(combination):
+        if result_element is None:
             return "Combination known to produce no result"
 
+        # Check if already successful and result exists in available elements
+        if any(elem.cache_key == result_element.cache_key for elem in available_elements):
+            return f"Result '{result_element.name}' already exists in available elements"
+
         return None
 
     def get_combination_stats(self) -> Dict[str, int]:
         """Get statistics about combination attempts."""
+        successful = sum(1 for element in self._known_results.values() if element is not None)
         return {
             "total_tested": len(self._tested_combinations),
-            "successful": len(self._successful_combinations),
-            "failed": len(self._failed_combinations),
-            "success_rate": (
-                len(self._successful_combinations) / len(self._tested_combinations) * 100
-                if self._tested_combinations
-                else 0
-            ),
+            "successful": successful,
+            "failed": len(self._known_results) - successful,
+            "success_rate": (successful / len(self._tested_combinations) * 100 if self._tested_combinations else 0),
         }
 
     def get_untested_combinations(self, available_elements: List[Element]) -> List[Combination]:
         """Get all untested combinations from available elements."""
-        untested = []
+        return list(self.iter_untested_combinations(available_elements))
+
+    def iter_untested_combinations(self, available_elements: List[Element]) -> Iterator[Combination]:
+        """
+        Lazily yield untested combinations from available elements.
+
+        Pairs are checked against the tested set as they are reached, so pairs tested
+        after the iterator was created are skipped, and only consumed pairs are built.
+        """
+        # Resolve ids once and filter on int pairs; Combination objects are only built for untested pairs
+        ids = [self._intern(elem.cache_key) for elem in available_elements]
+
+        for i, (elem1, id1) in enumerate(zip(available_elements, ids)):
+            tested_bits = self._tested_combinations.bits  # Grows in place, so its length is checked live
+            # Later elements only: avoids duplicates and self-combinations
+            for elem2, id2 in zip(available_elements[i + 1 :], ids[i + 1 :]):
+                if id1 == id2:
+                    continue  # Same name, invalid combination
+                # pair_index, inlined for this hot loop
+                index = id2 * (id2 - 1) // 2 + id1 if id1 < id2 else id1 * (id1 - 1) // 2 + id2
+                byte = index >> 3
+                if byte >= len(tested_bits) or not tested_bits[byte] >> (index & 7) & 1:
+                    yield Combination(element1=elem1, element2=elem2)
 
-        for i, elem1 in enumerate(available_elements):
-            for elem2 in available_elements[i + 1 :]:  # Avoid duplicates and self-combinations
-                try:
-                    combination = self.create_combination(elem1, elem2)
-                    if not self.is_combination_tested(combination):
-                        untested.append(combination)
-                except ValueError:
-                    # Invalid combination, skip
-                    continue
+    def iter_untested_combinations_with(
+        self, new_elements: List[Element], existing_elements: List[Element]
+    ) -> Iterator[Combination]:
+        """Lazily yield untested combinations that involve at least one of new_elements."""
+        new_ids = [self._intern(elem.cache_key) for elem in new_elements]
+        partners = list(zip(existing_elements, [self._intern(elem.cache_key) for elem in existing_elements]))
 
-        return untested
+        for elem1, id1 in zip(new_elements, new_ids):
+            tested_bits = self._tested_combinations.bits  # Grows in place, so its length is checked live
+            for elem2, id2 in partners:
+                if id1 == id2:
+                    continue  # Same name, invalid combination
+                # pair_index, inlined for this hot loop
+                index = id2 * (id2 - 1) // 2 + id1 if id1 < id2 else id1 * (id1 - 1) // 2 + id2
+                byte = index >> 3
+                if byte >= len(tested_bits) or not tested_bits[byte] >> (index & 7) & 1:
+                    yield Combination(element1=elem1, element2=elem2)
+            # Later new elements also pair with this one
+            partners.append((elem1, id1))
 
     def get_cached_combinations_for_export(self) -> Dict:
         """Get combination cache in format suitable for file export."""
         return {
-            "successful": {key: element.to_dict() for key, element in self._successful_combinations.items()},
-            "failed": list(self._failed_combinations),
-            "tested": list(self._tested_combinations),
+            "successful": {
+                self._key_to_string(key): element.to_dict()
+                for key, element in self._known_results.items()
+                if element is not None
+            },
+            "failed": [self._key_to_string(key) for key, element in self._known_results.items() if element is None],
+            "tested": [self._key_to_string(key) for key in self._tested_combinations],
             "exported_at": datetime.now().isoformat(),
         }
 
     def load_cached_combinations_from_import(self, cache_data: Dict) -> None:
         """Load combination cache from imported data."""
         # Load successful combinations
+        self._element_registry = {}
+        successful: Dict[Tuple[int, int], Element] = {}
         successful_data = cache_data.get("successful", {})
-        for key, element_data in successful_data.items():
+        for cache_key, element_data in successful_data.items():
+            key = self._string_to_key(cache_key)
+            if key is None:
+                continue
             try:
-                element = Element.from_dict(element_data)
-                self._successful_combinations[key] = element
+                successful[key] = self._register_element(Element.from_dict(element_data))
             except Exception:
                 # Skip invalid elements
                 continue
 
-        # Load failed and tested sets
-        self._failed_combinations = set(cache_data.get("failed", []))
-        self._tested_combinations = set(cache_data.get("tested", []))
+        # Failed pairs first, so a pair listed as both keeps its successful result
+        self._known_results = dict.fromkeys(self._keys_from_strings(cache_data.get("failed", [])))
+        self._known_results.update(successful)
+        self._tested_combinations = PairBitmap(self._keys_from_strings(cache_data.get("tested", [])))
 
         # Ensure consistency: all successful/failed combinations are marked as tested
-        self._tested_combinations.update(self._successful_combinations.keys())
-        self._tested_combinations.update(self._failed_combinations)
+        self._tested_combinations.update(self._known_results.keys())
+
+    def _keys_from_strings(self, cache_keys: List[str]) -> Set[Tuple[int, int]]:
+        """Parse a list of "a+b" cache file keys, dropping malformed entries."""
+        keys = set()
+        for cache_key in cache_keys:
+            key = self._string_to_key(cache_key)
+            if key is not None:
+                keys.add(key)
+        return keys
 
     def clear_cache(self) -> None:
         """Clear all cached combination data."""
-        self._successful_combinations.clear()
-        self._failed_combinations.clear()
+        self._known_results.clear()
         self._tested_combinations.clear()
+        self._element_registry.clear()
@@ -1,6 +1,6 @@
 """Pure game mechanics and rules - no external dependencies."""
 
-from typing import List, Tuple
+from typing import Tuple
 
 from ..models.element import Element, ElementPosition
 
@@ -25,6 +25,9 @@ class GameMechanics:
     # Tolerance constants (from utils.py)
     MERGE_DISTANCE_TOLERANCE = 50  # Distance elements can be apart and still merge
     ELEMENT_POSITION_TOLERANCE = 60  # Tolerance for element position detection
+    # Squared forms, so distance checks compare against them without a sqrt or a per-call multiply
+    MERGE_DISTANCE_TOLERANCE_SQ = MERGE_DISTANCE_TOLERANCE * MERGE_DISTANCE_TOLERANCE
+    ELEMENT_POSITION_TOLERANCE_SQ = ELEMENT_POSITION_TOLERANCE * ELEMENT_POSITION_TOLERANCE
 
     # Drag constants (from utils.py)
     DRAG_PIXEL_STEPS = 300  # Pixels per drag step
@@ -33,13 +36,13 @@ class GameMechanics:
 
     # Workspace management (from utils.py)
     MAX_ELEMENTS_BEFORE_CLEAR = 5  # Clear workspace after 5 attempts
-    PREDEFINED_LOCATIONS = [
+    PREDEFINED_LOCATIONS = (
         (300, 250),  # Top left (safe zone)
         (700, 250),  # Top right (safe zone)
         (350, 350),  # Bottom left (safe zone)
         (650, 350),  # Bottom right (safe zone)
         (500, 300),  # Center (safe zone)
-    ]
+    )
 
     # Basic starting elements
     BASIC_ELEMENTS = {"fire", "water", "earth", "wind", "air"}
@@ -56,15 +59,10 @@ class GameMechanics:
         Returns:
             True if combination is valid, False otherwise
         """
-        # Cannot combine element with itself
-        if elem1 == elem2:
-            return False
-
-        # Cannot combine elements with same name (case-insensitive)
-        if elem1.cache_key == elem2.cache_key:
-            return False
-
-        return True
+        # Cannot combine elements with same name (case-insensitive). This also rules out
+        # combining an element with itself, since equal elements share a name; the keys are
+        # interned, so this is usually an identity check rather than a field-by-field __eq__.
+        return elem1.cache_key != elem2.cache_key
 
     @classmethod
     def get_merge_timeout(cls) -> float:
@@ -83,9 +81,9 @@ class GameMechanics:
         return bounds["min_x"] <= position.x <= bounds["max_x"] and bounds["min_y"] <= position.y <= bounds["max_y"]
 
     @classmethod
-    def get_predefined_locations(cls) -> List[Tuple[int, int]]:
-        """Get list of predefined safe workspace locations."""
-        return cls.PREDEFINED_LOCATIONS.copy()
+    def get_predefined_locations(cls) -> Tuple[Tuple[int, int], ...]:
+        """Get the predefined safe workspace locations (shared, immutable)."""
+        return cls.PREDEFINED_LOCATIONS
 
     @classmethod
     def is_basic_element(cls, element: Element) -> bool:
@@ -98,6 +96,13 @@ class GameMechanics:
         steps = max(int(distance / cls.DRAG_PIXEL_STEPS), 1)
         return min(steps, cls.DRAG_MAX_STEPS)
 
+    @staticmethod
+    def ease_in_out_cubic(t: float) -> float:
+        """Cubic ease-in-out for drag progress t in [0, 1]."""
+        if t < 0.5:
+            return 4 * t * t * t
+        return 1 - (-2 * t + 2) ** 3 / 2
+
     @classmethod
     def should_clear_workspace(cls, element_count: int) -> bool:
         """Determine if workspace should be cleared based on element count."""
@@ -106,9 +111,9 @@ class GameMechanics:
     @classmethod
     def elements_can_merge(cls, pos1: ElementPosition, pos2: ElementPosition) -> bool:
         """Check if two elements at given positions can merge."""
-        return pos1.is_within_tolerance(pos2, cls.MERGE_DISTANCE_TOLERANCE)
+        return pos1.is_within_tolerance_sq(pos2, cls.MERGE_DISTANCE_TOLERANCE_SQ)
 
     @classmethod
     def is_element_positioned_correctly(cls, actual_pos: ElementPosition, target_pos: ElementPosition) -> bool:
         """Check if element is positioned within acceptable tolerance of target."""
-        return actual_pos.is_within_tolerance(target_pos, cls.ELEMENT_POSITION_TOLERANCE)
+        return actual_pos.is_within_tolerance_sq(target_pos, cls.ELEMENT_POSITION_TOLERANCE_SQ)
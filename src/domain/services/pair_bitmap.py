@@ -0,0 +1,79 @@
+"""Compact set of element id pairs - no external dependencies."""
+
+from math import isqrt
+from typing import Iterable, Iterator, Tuple
+
+
+def pair_index(low: int, high: int) -> int:
+    """
+    Get the bit index of an ordered id pair (low < high) in a lower-triangular layout.
+
+    All pairs of ids below `high` come before `high`'s row, so the bitmap only
+    grows at the end as new element ids are interned. There is no slot for
+    low == high: pair_index(i, i) would alias pair_index(0, i + 1).
+    """
+    return high * (high - 1) // 2 + low
+
+
+class PairBitmap:
+    """
+    Set of (low_id, high_id) pairs packed one bit per pair.
+
+    Behaves like a set of ordered id tuples for membership, iteration and size,
+    while storing N elements' pairs in about N²/16 bytes.
+    """
+
+    def __init__(self, pairs: Iterable[Tuple[int, int]] = ()):
+        """
+        Initialize bitmap.
+
+        Args:
+            pairs: Optional ordered (low, high) pairs to add
+        """
+        self.bits = bytearray()
+        self._count = 0
+        self.update(pairs)
+
+    def add(self, pair: Tuple[int, int]) -> None:
+        """Add an ordered (low, high) pair; raises ValueError unless low < high."""
+        low, high = pair
+        if not 0 <= low < high:
+            raise ValueError(f"Pair {pair} is not an ordered pair of distinct ids")
+        index = pair_index(low, high)
+        byte, mask = index >> 3, 1 << (index & 7)
+        if byte >= len(self.bits):
+            self.bits.extend(bytes(byte + 1 - len(self.bits)))
+        if not self.bits[byte] & mask:
+            self.bits[byte] |= mask
+            self._count += 1
+
+    def update(self, pairs: Iterable[Tuple[int, int]]) -> None:
+        """Add several ordered pairs."""
+        for pair in pairs:
+            self.add(pair)
+
+    def clear(self) -> None:
+        """Remove all pairs."""
+        self.bits.clear()
+        self._count = 0
+
+    def __contains__(self, pair: Tuple[int, int]) -> bool:
+        low, high = pair
+        if not 0 <= low < high:
+            return False
+        index = pair_index(low, high)
+        byte = index >> 3
+        return byte < len(self.bits) and bool(self.bits[byte] >> (index & 7) & 1)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        for byte, value in enumerate(self.bits):
+            if not value:
+                continue
+            for bit in range(8):
+                if value >> bit & 1:
+                    index = (byte << 3) | bit
+                    high = (1 + isqrt(1 + 8 * index)) // 2
+                    yield index - high * (high - 1) // 2, high
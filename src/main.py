@@ -7,14 +7,16 @@ Uses Clean Architecture with service-oriented design.
 """
 
 import argparse
+import traceback
 from typing import Optional
 
 from automations import ServiceAutomationController, ServiceTargetWordAutomation
-from config import config
 
 
 def run_element_discovery(target_elements: Optional[int] = None, max_attempts: Optional[int] = None) -> bool:
     """Run element discovery automation."""
+    from config import config
+
     # Use config defaults if not provided
     target_elements = target_elements or config.DEFAULT_TARGET_ELEMENTS
     max_attempts = max_attempts or config.DEFAULT_MAX_DISCOVERY_ATTEMPTS
@@ -75,7 +77,6 @@ def run_element_discovery(target_elements: Optional[int] = None, max_attempts: O
         return False
     except Exception as e:
         print(f"❌ Automation failed: {e}")
-        import traceback
 
         traceback.print_exc()
         return False
@@ -85,6 +86,8 @@ def run_target_word_hunt(
     target_word: str, max_attempts: Optional[int] = None, combinations_per_iteration: Optional[int] = None
 ) -> bool:
     """Run target word hunting automation."""
+    from config import config
+
     # Use config defaults if not provided
     max_attempts = max_attempts or config.DEFAULT_MAX_HUNT_ATTEMPTS
     combinations_per_iteration = combinations_per_iteration or config.DEFAULT_COMBINATIONS_PER_ITERATION
@@ -136,9 +139,7 @@ def run_target_word_hunt(
             if results.get("discoveries"):
                 print("🔬 Discoveries made:")
                 for i, discovery in enumerate(results["discoveries"], 1):
-                    print(
-                        f"   {i}. {discovery['combination']} = {discovery['result']} (🧠 {discovery['similarity']:.3f})"
-                    )
+                    print(f"   {i}. {discovery.combination} = {discovery.result} (🧠 {discovery.similarity:.3f})")
 
         else:
             print(f"❌ FAILED: Could not find '{results['target_word']}'")
@@ -149,7 +150,7 @@ def run_target_word_hunt(
                 if results.get("discoveries"):
                     print("🔬 Elements discovered:")
                     for discovery in results["discoveries"]:
-                        print(f"   • {discovery['combination']} = {discovery['result']}")
+                        print(f"   • {discovery.combination} = {discovery.result}")
 
         if results.get("error"):
             print(f"⚠️ Error: {results['error']}")
@@ -165,7 +166,6 @@ def run_target_word_hunt(
         return False
     except Exception as e:
         print(f"❌ Target hunt failed: {e}")
-        import traceback
 
         traceback.print_exc()
         return False
@@ -173,6 +173,8 @@ def run_target_word_hunt(
 
 def main():
     """Main entry point with command line interface."""
+    from config import config
+
     parser = argparse.ArgumentParser(
         description="Infinite Craft Bot - Service-Oriented Automation",
         formatter_class=argparse.RawDescriptionHelpFormatter,